@@ -4,13 +4,14 @@ from os import listdir
 
 from discord import Intents
 from discord.ext.commands import Bot
-from discord_slash import SlashCommand
 
 from const import get_secret, get_const, override_const
 from util import set_programwide
+from util.metrics import MetricsSlashCommand, serve_metrics
+from util.profiler import CommandProfiler, PROFILE_DIRECTORY
 
 bot = Bot(command_prefix='$$', self_bot=True, intents=Intents.all())
-slash = SlashCommand(bot, sync_commands=True)
+slash = MetricsSlashCommand(bot, sync_commands=True)
 
 guild_ids = set_programwide('guild_ids', list())
 
@@ -52,6 +53,11 @@ def main():
                         help='이 정규표현식을 만족하는 이름을 가진 코그만 실행합니다')
     parser.add_argument('-o', '--override', action='append',
                         help='const를 override합니다. `key=value`의 형태로 입력합니다.')
+    parser.add_argument('-p', '--profile', action='store', nargs='?', const=r'.*',
+                        help='이 정규표현식을 만족하는 이름을 가진 명령어를 처리하는 동안 프로파일링하고, '
+                             f'명령어별 결과를 `{PROFILE_DIRECTORY}`에 씁니다. 정규표현식을 주지 않으면 모든 명령어를 프로파일링합니다')
+    parser.add_argument('--profile-interval', action='store', type=float, default=300,
+                        help='프로파일링 결과를 쓰는 간격(초)')
 
     args = parser.parse_args()
 
@@ -65,8 +71,18 @@ def main():
             print(f'Constant overrode: {key} = {value}')
 
     load_cogs(args.cog)
+    if get_const('metrics_port'):
+        bot.loop.create_task(serve_metrics(get_const('metrics_host'), get_const('metrics_port')))
+    if args.profile is not None:
+        print(f'Profiling commands matching `{args.profile}` ...')
+        slash.profiler = CommandProfiler(args.profile, interval=args.profile_interval)
+        bot.loop.create_task(slash.profiler.dump_periodically())
+
     bot.run(get_secret('test_bot_token' if args.test else 'bot_token'))
 
+    if slash.profiler is not None:
+        slash.profiler.dump()
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,154 @@
+import json
+import os
+import platform
+import subprocess
+import tracemalloc
+from argparse import ArgumentParser
+from asyncio import run
+from datetime import datetime
+from statistics import median
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from benchmark.synthetic import DIACRITIC_LETTERS, LAYOUTS, make_rows
+from database import Database
+from database.basis import search_cache
+
+RESULT_DIRECTORY = 'cache/benchmarks'
+NO_HIT_QUERY = 'qxzqxzqxz'
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_queries(database: Database, rows: List[List[str]]) -> Dict[str, str]:
+    """ 짧은 검색어, 긴 검색어, 다이어크리틱이 있는 검색어, 아무것도 찾지 못하는 검색어를 시트 값에서 고릅니다. """
+    headwords = [database.headword(row) for row in rows[len(rows) // 2:]]
+    return {
+        'short': headwords[0][:2],
+        'long': next((word for word in headwords if len(word) >= 6 and word.isascii()), headwords[0]),
+        'diacritic': next((word for word in headwords if any(c in DIACRITIC_LETTERS for c in word)), headwords[0]),
+        'no_hit': NO_HIT_QUERY,
+    }
+
+
+async def measure_query(database: Database, query: str, repeat: int) -> dict:
+    """
+    캐시를 비운 채로 ``query``를 ``repeat`` 번 검색한 지연 시간과, 캐시된 결과를 다시 검색한 지연 시간을 잽니다.
+    """
+    latencies = list()
+    result = None
+    for _ in range(repeat):
+        search_cache.clear()
+        start = perf_counter()
+        result = await database.search_rows(query)
+        latencies.append((perf_counter() - start) * 1000)
+
+    start = perf_counter()
+    await database.search_rows(query)
+    cached_latency = (perf_counter() - start) * 1000
+
+    latencies.sort()
+    return {
+        'query': query,
+        'hits': len(result),
+        'duplicates': len(result.duplicates),
+        'median_ms': median(latencies),
+        'p95_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        'max_ms': latencies[-1],
+        'cached_ms': cached_latency,
+    }
+
+
+def measure_layout(layout: str, row_count: int, repeat: int, memory: bool, seed: int, columnar: bool) -> dict:
+    """ 한 시트 모양과 행 수에 대해 시트 값을 만들고, 검색용 자료를 만드는 시간과 메모리, 검색 지연 시간을 잽니다. """
+    make_database, _ = LAYOUTS[layout]
+    database = make_database()
+    database.columnar = columnar
+
+    if memory:
+        tracemalloc.start()
+    rows = make_rows(layout, row_count, seed)
+    result = {'layout': layout, 'rows': row_count}
+    if memory:
+        result['sheet_memory_bytes'] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    start = perf_counter()
+    data = database.build_data(rows)
+    result['build_seconds'] = perf_counter() - start
+
+    if memory:
+        del data
+        tracemalloc.start()
+        data = database.build_data(rows)
+        result['index_memory_bytes'], result['build_peak_memory_bytes'] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    database.set_data(data)
+
+    async def measure_queries():
+        return {kind: await measure_query(database, query, repeat)
+                for kind, query in make_queries(database, rows).items()}
+    result['queries'] = run(measure_queries())
+    return result
+
+
+def main():
+    parser = ArgumentParser(description='가짜 사전으로 사전 검색의 성능을 잽니다.')
+    # noinspection PyProtectedMember
+    parser._actions[0].help = '도움말 메시지를 보여주고 종료합니다'
+    parser.add_argument('-l', '--layout', action='append', choices=list(LAYOUTS),
+                        help='잴 시트 모양. 여러 번 줄 수 있으며, 주지 않으면 모든 모양을 잽니다')
+    parser.add_argument('-r', '--rows', action='append', type=int,
+                        help='가짜 사전의 행 수. 여러 번 줄 수 있으며, 주지 않으면 1000, 10000, 100000, 1000000 행을 잽니다')
+    parser.add_argument('-n', '--repeat', action='store', type=int, default=20,
+                        help='검색어마다 검색을 반복할 횟수')
+    parser.add_argument('-s', '--seed', action='store', type=int, default=0,
+                        help='가짜 사전을 만들 난수 시드')
+    parser.add_argument('--columnar', action='store_true',
+                        help='열들을 이어 붙인 버퍼로 검색합니다')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='메모리 사용량을 재지 않습니다. 큰 사전에서 시간을 줄일 수 있습니다')
+    parser.add_argument('-o', '--output', action='store',
+                        help=f'결과를 저장할 JSON 파일. 주지 않으면 `{RESULT_DIRECTORY}`에 커밋 이름으로 저장합니다')
+
+    args = parser.parse_args()
+
+    commit = get_commit()
+    report = {
+        'commit': commit,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'columnar': args.columnar,
+        'results': list(),
+    }
+    for layout in args.layout or list(LAYOUTS):
+        for row_count in args.rows or [1000, 10000, 100000, 1000000]:
+            print(f'Measuring `{layout}` with {row_count} rows ...')
+            result = measure_layout(layout, row_count, args.repeat, not args.no_memory, args.seed,
+                                    args.columnar)
+            report['results'].append(result)
+
+            print(f'  build: {result["build_seconds"]:.3f}s')
+            for kind, query in result['queries'].items():
+                print(f'  {kind} `{query["query"]}`: {query["hits"]} hits, median {query["median_ms"]:.3f}ms, '
+                      f'p95 {query["p95_ms"]:.3f}ms, cached {query["cached_ms"]:.3f}ms')
+
+    output = args.output or os.path.join(
+        RESULT_DIRECTORY, f'search-{commit or datetime.now().strftime("%Y%m%d-%H%M%S")}.json')
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f'Results saved to `{output}`.')
+
+
+if __name__ == '__main__':
+    main()
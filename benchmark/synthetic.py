@@ -0,0 +1,81 @@
+from random import Random
+from typing import Callable, Dict, List, Tuple
+
+from database import Database, PosDatabase
+from database.enjie import EnjieDatabase
+from database.ropona import RoponaDatabase
+from database.zasok import ZasokeseWord
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+DIACRITIC_LETTERS = 'áàâäéèêëíîïóôöúûüčšžñ'
+# 단어 모양의 글자가 다이어크리틱이 붙은 글자일 확률
+DIACRITIC_RATE = 0.15
+# 뜻에 쓰이는 한국어 낱말의 수. 실제 사전처럼 같은 뜻이 여러 단어에 나오도록 어휘를 제한합니다.
+VOCABULARY_SIZE = 5000
+POS_NAMES = ('명사', '동사', '형용사', '부사', '전치사', '접속사')
+
+
+class SyntheticWords:
+    """ 시드를 정하면 언제나 같은 단어 모양과 뜻을 만들어냅니다. """
+
+    def __init__(self, seed: int = 0):
+        self.random = Random(seed)
+        self.vocabulary = [self.korean_word() for _ in range(VOCABULARY_SIZE)]
+
+    def korean_word(self) -> str:
+        return ''.join(chr(self.random.randint(0xAC00, 0xD7A3)) for _ in range(self.random.randint(1, 4)))
+
+    def word(self) -> str:
+        return ''.join(
+            self.random.choice(DIACRITIC_LETTERS if self.random.random() < DIACRITIC_RATE else LETTERS)
+            for _ in range(self.random.randint(3, 10)))
+
+    def meaning(self) -> str:
+        return ', '.join(self.random.sample(self.vocabulary, self.random.randint(1, 3)))
+
+    def optional_meaning(self, rate: float = 0.5) -> str:
+        return self.meaning() if self.random.random() < rate else ''
+
+    def pos(self) -> str:
+        return self.random.choice(POS_NAMES)
+
+
+def zasokese_row(words: SyntheticWords, row_id: int) -> List[str]:
+    return [str(row_id), words.word(), str(words.random.randint(0, 5)), words.optional_meaning(),
+            words.optional_meaning(0.3), words.optional_meaning(0.4), words.optional_meaning(0.1),
+            words.optional_meaning(0.05), words.optional_meaning(0.1), '', '']
+
+
+def pos_row(words: SyntheticWords, row_id: int) -> List[str]:
+    return [words.word(), words.meaning(), words.pos(), words.optional_meaning(0.1)]
+
+
+def ropona_row(words: SyntheticWords, row_id: int) -> List[str]:
+    word = words.word()
+    return [word, word, word, word, word, words.pos(), words.meaning(), str(words.random.randint(0, 3)), '']
+
+
+def enjie_row(words: SyntheticWords, row_id: int) -> List[str]:
+    return [words.word(), words.word(), words.meaning(), words.pos(), '', '', str(words.random.randint(0, 3))]
+
+
+# 이름과, 데이터베이스를 만드는 함수와, 그 데이터베이스의 시트 모양대로 행 하나를 만드는 함수
+LAYOUTS: Dict[str, Tuple[Callable[[], Database], Callable[[SyntheticWords, int], List[str]]]] = {
+    'zasokese': (lambda: Database(ZasokeseWord, 'zasokese_database'), zasokese_row),
+    'pos': (lambda: PosDatabase('chrisancthian_database', 0, 0, 2, 1, 3), pos_row),
+    'ropona': (lambda: RoponaDatabase('ropona_database'), ropona_row),
+    'enjie': (lambda: EnjieDatabase('enjie_database'), enjie_row),
+}
+
+
+def make_rows(layout: str, row_count: int, seed: int = 0) -> List[List[str]]:
+    """
+    ``layout`` 데이터베이스의 시트 모양을 따르는 가짜 시트 값을 만듭니다.
+
+    :param layout: ``LAYOUTS``의 이름
+    :param row_count: 만들 행의 수
+    :param seed: 난수 시드
+    """
+    words = SyntheticWords(seed)
+    _, make_row = LAYOUTS[layout]
+    return [make_row(words, row_id) for row_id in range(row_count)]
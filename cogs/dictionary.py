@@ -1,12 +1,17 @@
-from asyncio import sleep, TimeoutError as AsyncTimeoutError
+from asyncio import gather, wait, wrap_future, TimeoutError as AsyncTimeoutError
+from datetime import datetime, timedelta
+from random import uniform
+from typing import Tuple, FrozenSet
 
 from discord import Embed
+from discord.ext import tasks
 from discord.ext.commands import Cog, Bot
 from discord_slash import SlashContext, cog_ext, SlashCommandOptionType
 from discord_slash.utils.manage_commands import create_option
 
 from const import get_const
 from database import Database, DialectDatabase, PosDatabase, SimpleDatabase
+from database.basis import DatabaseData, search_cache, find_rows
 from database.arteut import ArteutWord
 from database.enjie import EnjieDatabase
 from database.hemelvaarht import ThravelemehWord
@@ -20,16 +25,19 @@ from database.slengeus import SlengeusWord
 from database.zasok import ZasokeseWord, BerquamWord
 from database.fsovm import FsovmWord
 from database.pasel import PaselWord
+from database.loader import load_databases
 from util import get_programwide
+from util.autocomplete import AutocompleteContext, create_autocomplete_option
+from util.general import normalise
+from util.metrics import phase
 from util.simetasis import zasokese_to_simetasise
 
+zasokese_database = Database(ZasokeseWord, "zasokese_database")
 databases = {
-    "zasokese": Database(ZasokeseWord, "zasokese_database"),
+    "zasokese": zasokese_database,
     "thravelemeh": Database(ThravelemehWord, "thravelemeh_database"),
     "berquam": Database(BerquamWord, "zasokese_database", 1),
-    "simetasispika": DialectDatabase(
-        ZasokeseWord, "zasokese_database", zasokese_to_simetasise
-    ),
+    "simetasispika": DialectDatabase(zasokese_database, zasokese_to_simetasise),
     "4351": Database(SesameWord, "4351_database", 0),
     "iremna": Database(IremnaWord, "iremna_database", 0),
     "arteut": Database(ArteutWord, "arteut_database", 0),
@@ -44,9 +52,54 @@ databases = {
     "slengeus": Database(SlengeusWord, "slengeus_database", 0),
     "pasel": Database(PaselWord, "pasel_database", 0),
 }
+for language in ("zasokese", "thravelemeh", "simetasispika"):
+    databases[language].columnar = True
+# 언어별로, 시트에서 불러오는 일이 끝나면 완료되는 ``Future``
+loading_futures = load_databases(databases)
+# 언어별로, 실제로 시트에서 값을 불러오는 데이터베이스의 언어. 파생 데이터베이스는 부모 데이터베이스의 언어입니다.
+SOURCE_LANGUAGES = {
+    language: next(name for name, source in databases.items() if source is database.source)
+    for language, database in databases.items()
+}
 
 guild_ids = get_programwide("guild_ids")
 
+# 검색 명령어 이름과 그 명령어가 검색하는 데이터베이스
+COMMAND_DATABASES = {
+    "zasok": "zasokese",
+    "th": "thravelemeh",
+    "berquam": "berquam",
+    "sts": "simetasispika",
+    "4351": "4351",
+    "iremna": "iremna",
+    "arteut": "arteut",
+    "enjie": "enjie",
+    "mikhoros": "mikhoros",
+    "pain": "pain",
+    "fsovm": "fsovm",
+    "chris": "chrisancthian",
+    "sches": "scheskatte",
+    "ropona": "ropona",
+    "lazhon": "lazhon",
+    "slengeus": "slengeus",
+    "pasel": "pasel",
+}
+
+# 임베드 하나에 보여줄 단어의 최대 개수. 디스코드 임베드는 필드를 25개까지 가질 수 있습니다.
+MAX_EMBED_WORDS = 25
+
+LANGUAGE_COMMANDS = {language: command for command, language in COMMAND_DATABASES.items()}
+SEARCH_ALL_WORDS_PER_LANGUAGE = 5
+
+REFRESH_JITTER = 0.1
+REFRESH_RETRY_INTERVAL = timedelta(minutes=10)
+
+
+def get_refresh_interval(language: str) -> timedelta:
+    """ ``database_refresh_hours`` const에서 언어별 데이터베이스 갱신 주기를 불러옵니다. """
+    refresh_hours = get_const("database_refresh_hours")
+    return timedelta(hours=refresh_hours.get(language, refresh_hours["default"]))
+
 
 async def handle_dictionary(
     ctx: SlashContext, database: Database, embed: Embed, query: str
@@ -61,42 +114,118 @@ async def handle_dictionary(
     """
     message = await ctx.send(f"`{query}`에 대해 검색 중입니다…")
 
-    words, duplicates, reloaded = await database.search_rows(query)
-    too_many = False
-    if (word_count := len(words)) > 25:
-        too_many = True
-        words = list(map(lambda x: words[x], duplicates))
-        duplicates = set()
-
-    index_offset = 0
-    while duplicates and words:
-        word = words.pop(duplicates.pop() - index_offset)
-        word.add_to_field(embed, True)
-        index_offset += 1
-    for word in words:
-        word.add_to_field(embed)
-    if not words and not index_offset:
-        embed.add_field(name="검색 결과", value="검색 결과가 없습니다.")
-    if too_many:
-        embed.add_field(
-            name="기타",
-            value=f"단어나 뜻에 `{query}`가 들어가는 단어가 {word_count - index_offset} 개 더 있습니다.",
-        )
+    with phase("search"):
+        result = await database.search_rows(query)
+        suggestions = database.suggest_rows(query) if not result else list()
 
-    await message.edit(
-        content="데이터베이스를 다시 불러왔습니다." if reloaded else "", embed=embed
-    )
+    with phase("render"):
+        if len(result) > MAX_EMBED_WORDS:
+            shown = sorted(result.duplicates)[: MAX_EMBED_WORDS - 1]
+            for index in shown:
+                result.word(index).add_to_field(embed, True)
+        else:
+            shown = range(len(result))
+            for index in sorted(result.duplicates):
+                result.word(index).add_to_field(embed, True)
+            for index in shown:
+                if index not in result.duplicates:
+                    result.word(index).add_to_field(embed)
+
+        if not result:
+            if suggestions:
+                embed.add_field(
+                    name="검색 결과",
+                    value="검색 결과가 없습니다. 혹시 이 단어를 찾으셨나요?",
+                    inline=False,
+                )
+                for word in suggestions:
+                    word.add_to_field(embed)
+            else:
+                embed.add_field(name="검색 결과", value="검색 결과가 없습니다.")
+        elif len(shown) < len(result):
+            embed.add_field(
+                name="기타",
+                value=f"단어나 뜻에 `{query}`가 들어가는 단어가 {len(result) - len(shown)} 개 더 있습니다.",
+            )
+
+    await message.edit(content="", embed=embed)
+
+
+def summarise_search_result(language: str, database: Database, data: DatabaseData,
+                            row_ids: Tuple[int, ...], duplicates: FrozenSet[int]) -> str:
+    """ 모든 사전 검색에서 한 언어의 검색 결과를, 일치하는 단어를 먼저 하여 몇 개만 보여줍니다. """
+    indices = sorted(duplicates) + [i for i in range(len(row_ids)) if i not in duplicates]
+
+    lines = list()
+    for i in indices[:SEARCH_ALL_WORDS_PER_LANGUAGE]:
+        headword = database.headword(data.sheet_values[row_ids[i]])
+        lines.append(f"__**{headword}** (일치)__" if i in duplicates else f"**{headword}**")
+    if len(row_ids) > SEARCH_ALL_WORDS_PER_LANGUAGE:
+        lines.append(f"외 {len(row_ids) - SEARCH_ALL_WORDS_PER_LANGUAGE} 개")
+    lines.append(f"`/{LANGUAGE_COMMANDS[language]}`로 자세히 보기")
+    return "\n".join(lines)
 
 
 class DictionaryCog(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
 
+        self.refresh_jitters = {language: uniform(1 - REFRESH_JITTER, 1 + REFRESH_JITTER) for language in databases}
+        self.refresh_retries = dict()
+
+        self.refresh_databases.start()
+
+    def cog_unload(self):
+        self.refresh_databases.cancel()
+
+    def get_next_refresh(self, language: str) -> datetime:
+        """
+        데이터베이스를 다음으로 갱신할 시각을 반환합니다. 여러 데이터베이스가 한꺼번에 갱신되지 않도록 주기를 조금씩 흩뜨립니다.
+        파생 데이터베이스는 부모 데이터베이스가 갱신될 때 함께 갱신되므로, 부모 데이터베이스의 시각을 반환합니다.
+        """
+        language = SOURCE_LANGUAGES[language]
+        next_refresh = databases[language].last_reload + get_refresh_interval(language) * self.refresh_jitters[language]
+        return max(next_refresh, self.refresh_retries.get(language, datetime.min))
+
+    @tasks.loop(minutes=1)
+    async def refresh_databases(self):
+        now = datetime.now()
+        for language, database in databases.items():
+            # 파생 데이터베이스는 부모 데이터베이스가 갱신될 때 함께 갱신됩니다.
+            if SOURCE_LANGUAGES[language] != language or self.get_next_refresh(language) > now:
+                continue
+
+            try:
+                await database.reload_async()
+            except Exception as e:
+                print(f"Failed to refresh dictionary `{language}`: {e!r}")
+                self.refresh_retries[language] = now + REFRESH_RETRY_INTERVAL
+            else:
+                print(f"Dictionary `{language}` refreshed.")
+                self.refresh_jitters[language] = uniform(1 - REFRESH_JITTER, 1 + REFRESH_JITTER)
+
+    @refresh_databases.before_loop
+    async def before_refresh_databases(self):
+        await self.bot.wait_until_ready()
+        # 저장된 값으로 시작했다면 뒤에서 시트를 다시 불러오는 중이므로, 같은 시트를 또 불러오지 않도록 끝날 때까지 기다립니다.
+        # 실패한 데이터베이스는 저장된 값을 불러온 시각을 기준으로 갱신 시각이 정해지므로, 곧 다시 불러옵니다.
+        done, _ = await wait({wrap_future(future) for future in set(loading_futures.values())})
+        for future in done:
+            # 실패는 ``load_databases``가 이미 알렸습니다.
+            future.exception()
+
+    @Cog.listener()
+    async def on_autocomplete(self, ctx: AutocompleteContext):
+        if ctx.command not in COMMAND_DATABASES or ctx.focused_option != "query":
+            return
+
+        await ctx.send(databases[COMMAND_DATABASES[ctx.command]].complete(ctx.focused_value))
+
     @cog_ext.cog_slash(
         description="자소크어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query", description="검색할 단어", required=True, option_type=3
             )
         ],
@@ -128,7 +257,7 @@ class DictionaryCog(Cog):
         description="트라벨레메 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query", description="검색할 단어", required=True, option_type=3
             )
         ],
@@ -149,7 +278,7 @@ class DictionaryCog(Cog):
         description="베르쿠암 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query", description="검색할 단어", required=True, option_type=3
             )
         ],
@@ -170,7 +299,7 @@ class DictionaryCog(Cog):
         description="시메타시스 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query", description="검색할 단어", required=True, option_type=3
             )
         ],
@@ -192,7 +321,7 @@ class DictionaryCog(Cog):
         description="4351 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query", description="검색할 단어", required=True, option_type=3
             )
         ],
@@ -214,7 +343,7 @@ class DictionaryCog(Cog):
         description="이렘나어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -238,7 +367,7 @@ class DictionaryCog(Cog):
         description="아르토이트어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -262,7 +391,7 @@ class DictionaryCog(Cog):
         description="연서어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -286,7 +415,7 @@ class DictionaryCog(Cog):
         description="미코로스 아케뒤어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -310,7 +439,7 @@ class DictionaryCog(Cog):
         description="파인어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -334,7 +463,7 @@ class DictionaryCog(Cog):
         description="프소븜어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -358,7 +487,7 @@ class DictionaryCog(Cog):
         description="크리상테스어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -382,7 +511,7 @@ class DictionaryCog(Cog):
         description="셰스카테어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -406,7 +535,7 @@ class DictionaryCog(Cog):
         description="로포나어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -430,7 +559,7 @@ class DictionaryCog(Cog):
         description="라졔르베라어(라죤) 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -454,7 +583,7 @@ class DictionaryCog(Cog):
         description="규조어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -478,7 +607,7 @@ class DictionaryCog(Cog):
         description="파셀어 단어를 검색합니다.",
         guild_ids=guild_ids,
         options=[
-            create_option(
+            create_autocomplete_option(
                 name="query",
                 description="검색할 단어",
                 required=True,
@@ -498,6 +627,58 @@ class DictionaryCog(Cog):
             query,
         )
 
+    @cog_ext.cog_slash(
+        description="모든 사전에서 단어를 검색합니다.",
+        guild_ids=guild_ids,
+        options=[
+            create_option(
+                name="query",
+                description="검색할 단어",
+                required=True,
+                option_type=SlashCommandOptionType.STRING,
+            )
+        ],
+    )
+    async def search(self, ctx: SlashContext, query: str):
+        message = await ctx.send(f"`{query}`에 대해 모든 사전에서 검색 중입니다…")
+
+        with phase("search"):
+            normalised_query = normalise(query)
+            languages = list(databases.keys())
+            datas = [databases[language].data for language in languages]
+            results = await gather(
+                *(
+                    find_rows(databases[language], normalised_query, data)
+                    for language, data in zip(languages, datas)
+                )
+            )
+
+        with phase("render"):
+            found = [
+                (language, data, row_ids, duplicates)
+                for language, data, (row_ids, duplicates) in zip(languages, datas, results)
+                if row_ids
+            ]
+            found.sort(key=lambda x: (len(x[3]), len(x[2])), reverse=True)
+
+            embed = Embed(
+                title=f"`{query}`의 검색 결과",
+                description="모든 사전에서 단어를 검색합니다.",
+                color=get_const("shtelo_sch_vanilla"),
+            )
+            for language, data, row_ids, duplicates in found[:MAX_EMBED_WORDS]:
+                embed.add_field(
+                    name=f"{language} ({len(row_ids)} 개)",
+                    value=summarise_search_result(
+                        language, databases[language], data, row_ids, duplicates
+                    ),
+                    inline=False,
+                )
+            if not found:
+                embed.add_field(name="검색 결과", value="검색 결과가 없습니다.")
+
+        await message.edit(content="", embed=embed)
+
     @cog_ext.cog_slash(
         description="데이터베이스를 다시 불러옵니다.",
         guild_ids=guild_ids,
@@ -518,15 +699,27 @@ class DictionaryCog(Cog):
                 await message.edit(content="데이터베이스 이름을 확인해주세요!!")
                 return
 
-            databases[language].reload()
+            await databases[language].reload_async()
         else:
-            for database in databases.values():
-                database.reload()
-                await sleep(0)
+            sources = {database.source for database in databases.values()}
+            await gather(*(database.reload_async() for database in sources))
         await message.edit(
             content=f'{f"`{language}` " if language else ""}데이터베이스를 다시 불러왔습니다.'
         )
 
+    @cog_ext.cog_slash(
+        description="사전 검색 캐시의 상태를 확인합니다.",
+        guild_ids=guild_ids,
+    )
+    async def searchcache(self, ctx: SlashContext):
+        embed = Embed(title="사전 검색 캐시", color=get_const("shtelo_sch_vanilla"))
+        embed.add_field(name="크기", value=f"{len(search_cache.entries)} / {search_cache.maxsize}")
+        embed.add_field(name="적중", value=str(search_cache.hits))
+        embed.add_field(name="실패", value=str(search_cache.misses))
+        embed.add_field(name="적중률", value=f"{search_cache.hit_rate:.1%}")
+
+        await ctx.send(embed=embed)
+
     @cog_ext.cog_slash(
         description="사전 링크를 알려줍니다.",
         guild_ids=guild_ids,
@@ -548,6 +741,12 @@ class DictionaryCog(Cog):
         embed.add_field(
             name=f"`{language}` 사전의 링크", value=f"[여기를 클릭]({link})"
         )
+        embed.add_field(
+            name="마지막 갱신",
+            value=f"{databases[language].last_reload:%Y-%m-%d %H:%M:%S} "
+            f"(다음 갱신 예정: {self.get_next_refresh(language):%Y-%m-%d %H:%M:%S})",
+            inline=False,
+        )
 
         await ctx.send(embed=embed)
 
@@ -11,12 +11,13 @@ from discord.ext import tasks
 from discord.ext.commands import Cog, Bot
 from discord_slash import cog_ext, SlashContext, SlashCommandOptionType
 from discord_slash.utils.manage_commands import create_option
-from http3 import AsyncClient
 from sat_datetime import SatDatetime, SatTimedelta
 
 from const import get_const, get_secret
 from util import get_programwide, papago
+from util.metrics import phase
 from util.thravelemeh import WordGenerator, pool
+from util.web import CachedSession, WebError
 
 TRANSLATABLE_TABLE = {
     'ko': ['en', 'ja', 'zh-CN', 'zh-TW', 'es', 'fr', 'ru', 'vi', 'th', 'id', 'de', 'it'],
@@ -91,11 +92,14 @@ class UtilityCog(Cog):
         self.changes: Dict[str, List[int, int, str]] = dict()
 
         self.log_channel: Optional[TextChannel] = None
+        # 광부위키와 표준국어대사전 검색에 함께 쓰는 HTTP 세션
+        self.session = CachedSession()
 
         self.update_zacalen_channel.start()
 
     def cog_unload(self):
-        pass
+        self.bot.loop.create_task(self.session.close())
+        self.bot.loop.create_task(papago.close())
 
     @Cog.listener()
     async def on_ready(self):
@@ -547,9 +551,14 @@ class UtilityCog(Cog):
     async def gwangbu(self, ctx: SlashContext, query: str):
         message = await ctx.send('광부위키 문서 검색 중...')
 
-        client = AsyncClient()
-        response = await client.get(
-            f'http://wiki.shtelo.org/api.php?action=query&list=search&srsearch={query}&format=json')
+        try:
+            with phase('external'):
+                response = await self.session.get(
+                    'http://wiki.shtelo.org/api.php',
+                    params={'action': 'query', 'list': 'search', 'srsearch': query, 'format': 'json'})
+        except WebError:
+            await message.edit(content='광부위키에 연결하지 못했습니다. 잠시 후 다시 시도해주세요.')
+            return
 
         if response.status_code != 200:
             await message.edit(content='광부위키 문서 검색에 실패했습니다.')
@@ -624,15 +633,15 @@ class UtilityCog(Cog):
     async def korean(self, ctx: SlashContext, query: str):
         message = await ctx.send(f'표준국어대사전에서 `{query}` 단어를 검색하는 중입니다…')
 
-        client = AsyncClient()
         try:
-            r = await client.get(
-                'https://stdict.korean.go.kr/api/search.do',
-                params={'key': get_secret('korean_dictionary_api_key'), 'q': query, 'req_type': 'json'},
-                verify=False)
+            with phase('external'):
+                r = await self.session.get(
+                    'https://stdict.korean.go.kr/api/search.do',
+                    params={'key': get_secret('korean_dictionary_api_key'), 'q': query, 'req_type': 'json'},
+                    verify=False)
             j = r.json()
-        except ConnectionResetError:
-            await message.edit(content=f'`{query}`의 검색결과를 찾을 수 없습니다.')
+        except WebError:
+            await message.edit(content='표준국어대사전에 연결하지 못했습니다. 잠시 후 다시 시도해주세요.')
             return
         except JSONDecodeError:
             await message.edit(content=f'`{query}`의 검색결과가 없습니다.')
@@ -716,7 +725,13 @@ class UtilityCog(Cog):
                            f'> {languages}')
             return
 
-        result = papago.translate(sentence, from_language, to_language)
+        await ctx.defer()
+        try:
+            with phase('external'):
+                result = await papago.translate(sentence, from_language, to_language)
+        except papago.PapagoError:
+            await ctx.send('번역에 실패했습니다. 잠시 후 다시 시도해주세요.')
+            return
         await ctx.send(f'번역문\n> {sentence}\n번역 결과\n> {result}')
 
     @cog_ext.cog_slash(
@@ -1,7 +1,13 @@
 import json
+import os
+from copy import deepcopy
+from threading import Lock
 
 
 const_override = dict()
+# 파일 경로별로, 마지막으로 읽었을 때의 수정 시각과 크기, 그리고 읽은 값
+json_cache = dict()
+json_cache_lock = Lock()
 
 
 def get_secret(key: str):
@@ -19,6 +25,27 @@ def override_const(key: str, value):
     const_override[key] = value
 
 
+def load_json(path: str) -> dict:
+    """
+    Load json file, reusing the last parsed content unless the file has been modified since.
+
+    :param path: path to json file
+    :return: parsed content of the file
+    """
+    stat = os.stat(path)
+    version = stat.st_mtime_ns, stat.st_size
+
+    cached = json_cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with json_cache_lock:
+        with open(path, 'r') as file:
+            content = json.load(file)
+        json_cache[path] = version, content
+    return content
+
+
 def parse_json(path: str, key: str):
     """
     Parse json file and return value of key
@@ -27,11 +54,11 @@ def parse_json(path: str, key: str):
     :param key: key to get value
     :return: value of key
     """
-    with open(path, 'r') as file:
-        const = json.load(file)
+    const = load_json(path)
 
     key = key.split('.')
     while key:
         const = const[key.pop(0)]
 
-    return const
+    # 캐시된 값이 호출한 쪽에서 바뀌지 않도록, 리스트나 딕셔너리는 복사해서 반환합니다.
+    return deepcopy(const) if isinstance(const, (list, dict)) else const
@@ -2,6 +2,8 @@ from database import Word
 
 
 class ArteutWord(Word):
+    __slots__ = ('number', 'noun', 'det', 'adj', 'rel', 'verb', 'exp', 'note', 'source', 'origin', 'maker')
+
     def __init__(self, word: str, number: str = '', noun: str = '', det: str = '', adj: str = '', rel: str = '',
                  verb: str = '', exp: str = '', note: str = '', source: str = '', origin: str = '', maker: str = ''):
         super().__init__(word)
@@ -1,19 +1,33 @@
 import re
-from time import sleep as time_sleep
-from asyncio import sleep
-from datetime import datetime, timedelta
-from typing import Type, Tuple, List, Callable, Union, Any, Set
+from collections import defaultdict
+from asyncio import sleep, get_running_loop
+from datetime import datetime
+from functools import partial
+from itertools import count
+from time import perf_counter
+from typing import Type, Tuple, List, Callable, Dict, Optional, Set, FrozenSet, Iterable, Collection, Sequence
 
-import gspread
 from discord import Embed
 
-from const import get_const
+from database.cache import SearchCache
+from database.index import NgramIndex, DeletionIndex, PrefixIndex, ColumnarText
+from database.sheets import get_worksheet, call_paced
+from database.snapshot import get_snapshot_path, save_snapshot, load_snapshot
 from util.general import normalise
 
+MEANING_SEPARATOR = re.compile(r'[,;] ')
+# 검색 중 시간 예산을 넘었는지 확인하는 행 간격
+SCAN_CHECK_INTERVAL = 64
+
+generations = count()
+search_cache = SearchCache()
+
 
 class Word:
     back_slice = 0
     leading_rows = 1
+    word_column = 0
+    __slots__ = ('word',)
 
     def __init__(self, word: str):
         self.word = word
@@ -35,83 +49,404 @@ class Word:
         raise NotImplementedError
 
 
+class DatabaseData:
+    """
+    한 번 불러온 시트 값과, 그로부터 만든 검색용 자료입니다.
+    만든 뒤에는 바꾸지 않으며, 다시 불러올 때에는 새 객체를 만들어 통째로 바꿔 끼웁니다.
+    ``indexed``가 거짓이면 만드는 데 오래 걸리는 n-gram 색인과 비슷한 단어 색인이 없으며, 검색은 모든 행을 훑어 처리합니다.
+    """
+
+    def __init__(self, sheet_values: List[List[str]], normalised_rows: List[List[str]],
+                 ngram_index: Optional[NgramIndex], exact_index: Dict[str, Set[int]],
+                 fuzzy_index: Optional[DeletionIndex], prefix_index: PrefixIndex, columnar: Optional[ColumnarText],
+                 loaded_at: datetime, indexed: bool = True):
+        self.sheet_values = sheet_values
+        self.normalised_rows = normalised_rows
+        self.ngram_index = ngram_index
+        self.exact_index = exact_index
+        self.fuzzy_index = fuzzy_index
+        self.prefix_index = prefix_index
+        self.columnar = columnar
+        self.loaded_at = loaded_at
+        self.indexed = indexed
+        self.generation = next(generations)
+        # 이 자료로부터 함께 만든, 파생 데이터베이스들의 자료
+        self.views: Dict['Database', 'DatabaseData'] = dict()
+
+    def exact_matches(self, normalised_query: str) -> Collection[int]:
+        """ 단어 모양이나 뜻이 검색어와 일치하는 행의 번호들을 반환합니다. """
+        return self.exact_index.get(normalised_query, ())
+
+    def candidates(self, normalised_query: str) -> Tuple[Iterable[int], bool]:
+        """
+        검색어가 들어있을 수 있는 행의 번호들을 오름차순으로 반환합니다.
+
+        :return: 후보 행 번호들, 그리고 후보가 모두 검색어를 포함한다고 이미 확인되었는지 여부
+        """
+        row_ids = None if self.ngram_index is None else self.ngram_index.candidates(normalised_query)
+        if row_ids is None and self.columnar is not None:
+            row_ids = self.columnar.matches(normalised_query)
+            if row_ids is not None:
+                return row_ids, True
+        if row_ids is None:
+            row_ids = range(len(self.sheet_values))
+        return row_ids, False
+
+    def contains(self, row_id: int, normalised_query: str) -> bool:
+        """ ``row_id`` 번째 행의 검색 대상 열에 검색어가 들어있는지 반환합니다. """
+        return any(normalised_query in column for column in self.normalised_rows[row_id])
+
+
+class DialectRows(Sequence):
+    """ 부모 데이터베이스의 행들을 복사하지 않고, 읽을 때마다 표제어 열만 바꾼 행을 만들어 돌려줍니다. """
+
+    def __init__(self, rows: List[List[str]], column: int, headwords: List[str]):
+        self.rows = rows
+        self.column = column
+        self.headwords = headwords
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, row_id: int) -> List[str]:
+        row = self.rows[row_id]
+        return row[:self.column] + [self.headwords[row_id]] + row[self.column + 1:]
+
+
+class DialectData(DatabaseData):
+    """
+    파생 데이터베이스의 자료입니다. 부모 데이터베이스의 자료에서 표제어만 바꾼 것으로,
+    표제어가 아닌 열의 값, 정규화된 모양, 색인은 부모의 자료를 그대로 쓰고 표제어에 대한 것만 따로 가집니다.
+    ``ngram_index``와 ``exact_index``는 바꾼 표제어만으로 만든 색인입니다.
+    """
+
+    def __init__(self, parent: DatabaseData, column: int, headwords: List[str], normalised_headwords: List[str],
+                 ngram_index: Optional[NgramIndex], exact_index: Dict[str, Set[int]],
+                 fuzzy_index: Optional[DeletionIndex], prefix_index: PrefixIndex,
+                 exact_tokens: Callable[[list], set]):
+        """
+        :param parent: 부모 데이터베이스의 자료
+        :param column: 표제어 열의 번호
+        :param headwords: 행마다 바꾼 표제어
+        :param normalised_headwords: 행마다 바꾼 표제어의 정규화된 모양
+        :param exact_tokens: 행의 일치 단어 토큰을 만드는 함수
+        """
+        super().__init__(DialectRows(parent.sheet_values, column, headwords), parent.normalised_rows, ngram_index,
+                         exact_index, fuzzy_index, prefix_index, None, parent.loaded_at, parent.indexed)
+        self.parent = parent
+        self.column = column
+        self.normalised_headwords = normalised_headwords
+        self.exact_tokens = exact_tokens
+
+    def exact_matches(self, normalised_query: str) -> Collection[int]:
+        row_ids = set(self.exact_index.get(normalised_query, ()))
+        # 부모의 색인에서 찾은 행은, 바꾸기 전 표제어가 아닌 다른 열 때문에 일치한 것만 남깁니다.
+        for row_id in self.parent.exact_matches(normalised_query):
+            if row_id not in row_ids:
+                row = self.parent.sheet_values[row_id]
+                if normalised_query in self.exact_tokens(row[:self.column] + [''] + row[self.column + 1:]):
+                    row_ids.add(row_id)
+        return row_ids
+
+    def candidates(self, normalised_query: str) -> Tuple[Iterable[int], bool]:
+        # 부모의 후보에는 바꾸기 전 표제어 때문에 고른 행도 있으므로, 확인되지 않은 후보로 다룹니다.
+        row_ids, _ = self.parent.candidates(normalised_query)
+        if isinstance(row_ids, range):
+            return row_ids, False
+
+        headword_ids = None if self.ngram_index is None else self.ngram_index.candidates(normalised_query)
+        if headword_ids is None:
+            headword_ids = [row_id for row_id, headword in enumerate(self.normalised_headwords)
+                            if normalised_query in headword]
+        return sorted(set(row_ids).union(headword_ids)), False
+
+    def contains(self, row_id: int, normalised_query: str) -> bool:
+        row = self.normalised_rows[row_id]
+        if self.column >= len(row):
+            return any(normalised_query in column for column in row)
+        return normalised_query in self.normalised_headwords[row_id] \
+            or any(normalised_query in column for column in row[:self.column]) \
+            or any(normalised_query in column for column in row[self.column + 1:])
+
+
 class Database:
-    @staticmethod
-    def is_duplicate(query: str, row: list) -> bool:
-        return normalise(query) == normalise(row[0]) \
-               or any(normalise(query) in re.split(r'[,;] ', normalise(row[i])) for i in range(1, len(row)))
+    # 검색 후보를 고르는 n-gram 색인의 gram 길이. 0이면 색인을 만들지 않고 모든 행을 훑습니다.
+    ngram_size = 3
+    # 비슷한 단어를 찾을 최대 편집 거리. 짧은 단어는 이보다 작은 거리로 찾습니다. 0이면 비슷한 단어 색인을 만들지 않습니다.
+    fuzzy_distance = 2
+    # 검색할 때 이벤트 루프에 양보하지 않고 연속으로 행을 훑을 최대 시간(초)
+    scan_time_budget = 0.002
+    # 색인으로 후보를 좁힐 수 없는 검색을, 행마다 검사하는 대신 이어 붙인 열 버퍼에서 한 번에 찾을지 여부
+    columnar = False
 
     def __init__(self, word_class: Type[Word], spreadsheet_key: str, sheet_number: int = 0):
+        """
+        데이터베이스를 만듭니다. 시트에 연결하고 값을 불러오려면 ``connect``와 ``reload``를 호출하거나,
+        ``database.loader.load_databases``를 사용합니다.
+        """
         self.word_class = word_class
         self.spreadsheet_key = spreadsheet_key
+        self.sheet_number = sheet_number
+
+        self.sheet = None
+        self.views = list()
+        self.data = self.build_data(list())
 
-        print(f'Connecting to `{self.spreadsheet_key}` ...', end='\r')
+    @property
+    def sheet_values(self) -> List[List[str]]:
+        return self.data.sheet_values
 
-        time_sleep(2)
-        self.credential = gspread.service_account(filename='res/google_credentials.json')
-        self.sheet = self.credential.open_by_key(get_const(spreadsheet_key)).get_worksheet(sheet_number)
+    @property
+    def last_reload(self) -> datetime:
+        return self.data.loaded_at
 
-        print(f'Connected to `{self.spreadsheet_key}`.    ', end='\r')
-        print(f'Loading data from `{self.spreadsheet_key}` ...      ', end='\r')
+    @property
+    def source(self) -> 'Database':
+        """ 실제로 시트에서 값을 불러오는 데이터베이스를 반환합니다. 파생 데이터베이스가 아니면 자기 자신입니다. """
+        return self
 
-        self.last_reload = datetime.now()
-        self.sheet_values = None
-        self.reload()
+    def set_data(self, data: DatabaseData):
+        """ 검색용 자료를 바꿔 끼웁니다. 함께 만들어진 파생 데이터베이스들의 자료도 같이 바꿔 끼웁니다. """
+        self.data = data
+        for view, view_data in data.views.items():
+            view.data = view_data
+
+    def connect(self):
+        self.sheet = get_worksheet(self.spreadsheet_key, self.sheet_number)
+        return self
 
-        print(f'Dictionary from `{self.spreadsheet_key}` loaded.    ')
+    def fetch_data(self) -> DatabaseData:
+        """ 시트에서 값을 받아 저장해두고, 검색용 자료를 만들어 반환합니다. 이벤트 루프 밖의 스레드에서 호출해도 됩니다. """
+        if self.sheet is None:
+            self.connect()
+        sheet_values = call_paced(self.sheet.get_all_values)[self.word_class.leading_rows:]
+        save_snapshot(self.snapshot_path, sheet_values)
+        return self.build_data(sheet_values)
 
     def reload(self):
-        self.sheet_values = self.sheet.get_all_values()[self.word_class.leading_rows:]
-        self.last_reload = datetime.now()
+        self.set_data(self.fetch_data())
+        return self
+
+    async def reload_async(self):
+        """
+        시트에서 값을 받고 검색용 자료를 만드는 일을 스레드에서 하고, 다 만들어지면 한 번에 바꿔 끼웁니다.
+        그동안 이벤트 루프는 멈추지 않으며, 검색은 이전 자료로 계속 처리됩니다.
+        """
+        self.set_data(await get_running_loop().run_in_executor(None, self.fetch_data))
         return self
 
-    def add_row(self, values):
-        self.sheet.insert_row(values, index=2)
-        self.reload()
+    @property
+    def snapshot_path(self) -> str:
+        return get_snapshot_path(self.spreadsheet_key, self.sheet_number)
 
-    async def search_rows(self, query: str) -> Tuple[List[Word], set, bool]:
+    def load_snapshot(self) -> bool:
         """
-        rows: 단어 목록
+        마지막으로 불러왔던 시트 값을 디스크에서 불러옵니다. 시트에 연결하지 않아도 곧바로 검색할 수 있게 됩니다.
+        빨리 쓸 수 있도록 오래 걸리는 색인은 만들지 않으므로, 이어서 ``build_indexes``나 ``reload``를 호출해야 합니다.
 
-        duplicates: query와 뜻이나 단어 모양이 일치하는 단어 - 중요한 단어의 rows 내 index
+        :return: 저장된 값을 불러왔는가
+        """
+        snapshot = load_snapshot(self.snapshot_path)
+        if snapshot is None:
+            return False
+
+        saved_at, sheet_values = snapshot
+        self.set_data(self.build_data(sheet_values, saved_at, indexed=False))
+        return True
+
+    def build_indexes(self):
+        """
+        지금 자료가 색인 없이 만들어졌다면, 같은 시트 값으로 색인까지 만든 자료로 바꿔 끼웁니다. 이벤트 루프 밖의 스레드에서 호출해도 됩니다.
+        그동안 시트에서 다시 불러와 자료가 바뀌었다면 바꿔 끼우지 않습니다.
+        """
+        data = self.data
+        if data.indexed:
+            return
+        indexed_data = self.build_data(data.sheet_values, data.loaded_at, data.normalised_rows)
+        if self.data is data:
+            self.set_data(indexed_data)
+
+    def build_data(self, sheet_values: List[List[str]], loaded_at: Optional[datetime] = None,
+                   normalised_rows: Optional[List[List[str]]] = None, indexed: bool = True) -> DatabaseData:
+        """
+        시트 값으로부터 검색에 쓰이는 열들을 미리 정규화하고, n-gram 색인, 일치 단어 색인, 비슷한 단어 색인, 접두사 색인을 만듭니다.
+        ``columnar``가 참이면 열들을 이어 붙인 버퍼도 만듭니다. 파생 데이터베이스들의 자료도 함께 만듭니다.
+
+        :param sheet_values: 머리 행을 제외한 시트 값
+        :param loaded_at: 시트 값을 불러온 시각. 주어지지 않으면 지금 시각
+        :param normalised_rows: 미리 정규화해둔 검색 대상 열들. 주어지지 않으면 ``sheet_values``로부터 만듭니다.
+        :param indexed: 거짓이면 n-gram 색인과 비슷한 단어 색인을 만들지 않습니다.
+        """
+        loaded_at = loaded_at or datetime.now()
+        if normalised_rows is None:
+            normalised_rows = [list(map(normalise, self.searchable_columns(row))) for row in sheet_values]
+        ngram_index = NgramIndex(normalised_rows, self.ngram_size) if indexed and self.ngram_size else None
+
+        exact_index = defaultdict(set)
+        for row_id, row in enumerate(sheet_values):
+            for token in self.exact_tokens(row):
+                exact_index[token].add(row_id)
+
+        headwords = [self.headword(row) for row in sheet_values]
+        normalised_headwords = list(map(normalise, headwords))
+        fuzzy_index = DeletionIndex(normalised_headwords, self.fuzzy_distance) \
+            if indexed and self.fuzzy_distance else None
+        prefix_index = PrefixIndex(zip(normalised_headwords, headwords))
+
+        columnar = ColumnarText(normalised_rows) if self.columnar else None
+
+        data = DatabaseData(sheet_values, normalised_rows, ngram_index, dict(exact_index), fuzzy_index, prefix_index,
+                            columnar, loaded_at, indexed)
+        data.views.update((view, view.derive_data(data)) for view in self.views)
+        return data
+
+    def searchable_columns(self, row: list) -> list:
+        """ 검색 대상이 되는 열들을 반환합니다. """
+        return row[:-self.word_class.back_slice] if self.word_class.back_slice else row
+
+    def headword(self, row: list) -> str:
+        """ 행의 표제어를 반환합니다. """
+        return row[self.word_class.word_column]
+
+    def exact_tokens(self, row: list) -> set:
+        """ 검색어와 같으면 일치하는 단어로 취급할, 정규화된 단어 모양과 뜻들을 반환합니다. """
+        tokens = {normalise(row[0])}
+        for column in row[1:]:
+            tokens.update(MEANING_SEPARATOR.split(normalise(column)))
+        return tokens
+
+    def make_word(self, row: list) -> Word:
+        # noinspection PyArgumentList
+        return self.word_class(*row)
 
-        reloaded: 데이터베이스가 새로 로드되었는가
+    def insert_row(self, values):
+        """ 시트의 머리 행 바로 아래에 행을 추가합니다. 이벤트 루프 밖의 스레드에서 호출해도 됩니다. """
+        if self.sheet is None:
+            self.connect()
+        # 서버 오류가 나도 행은 추가되었을 수 있으므로, 요청 한도 초과일 때만 다시 시도합니다.
+        call_paced(partial(self.sheet.insert_row, values, index=2), retryable_status_codes=(429,))
+
+    async def add_row(self, values):
+        await get_running_loop().run_in_executor(None, partial(self.insert_row, values))
+        await self.reload_async()
+
+    async def search_rows(self, query: str) -> 'SearchResult':
+        """
+        단어나 뜻에 ``query``가 들어있는 행을 찾습니다.
+        데이터베이스는 ``DictionaryCog``가 주기적으로 갱신하므로, 검색 중에는 네트워크를 쓰지 않습니다.
 
         :param query: 찾을 단어
-        :return: rows, duplicates, reloaded
-        """
-        reloaded = False
-        if self.last_reload + timedelta(weeks=1) < datetime.now():
-            self.reload()
-            reloaded = True
-        duplicates = set()
-        rows = list()
-        for j, row in enumerate(self.sheet_values):
-            await sleep(0)
-            for i, column in enumerate(row[:-self.word_class.back_slice] if self.word_class.back_slice else row):
-                if normalise(query) in normalise(column):
-                    # noinspection PyArgumentList
-                    rows.append(self.word_class(*row))
-                    break
-            if self.is_duplicate(query, row):
-                duplicates.add(len(rows) - 1)
-        return rows, duplicates, reloaded
+        :return: 검색 결과
+        """
+        return await search_rows(self, query)
+
+    def complete(self, query: str, limit: int = 25) -> List[str]:
+        """ 정규화했을 때 ``query``로 시작하는 표제어들을 반환합니다. 자동 완성에 씁니다. """
+        return self.data.prefix_index.complete(normalise(query), limit)
+
+    def suggest_rows(self, query: str, limit: int = 5) -> List[Word]:
+        """
+        표제어가 ``query``와 비슷한 단어를, 편집 거리가 가까운 순서로 반환합니다.
+
+        :param query: 찾을 단어
+        :param limit: 반환할 단어의 최대 개수
+        """
+        data = self.data
+        if data.fuzzy_index is None:
+            return list()
+
+        return [self.make_word(data.sheet_values[row_id])
+                for row_id, _ in data.fuzzy_index.lookup(normalise(query))[:limit]]
 
 
 class DialectDatabase(Database):
-    def __init__(self, word_class: Type[Word], spreadsheet_key: str, convert_function: Callable[[str], str]):
+    """
+    다른 데이터베이스의 표제어를 방언으로 바꾸어 보여주는 파생 데이터베이스입니다.
+    시트를 따로 불러오지 않고, 부모 데이터베이스가 값을 불러올 때마다 그 자료로부터 표제어에 대한 자료만 만듭니다.
+    """
+
+    def __init__(self, parent: Database, convert_function: Callable[[str], str]):
+        """
+        :param parent: 값을 가져올 데이터베이스
+        :param convert_function: 부모 데이터베이스의 표제어를 방언으로 바꾸는 함수
+        """
+        self.parent = parent
         self.convert_function = convert_function
-        super().__init__(word_class, spreadsheet_key)
+        # 원래 표제어와, 그것을 바꾼 표제어와 그 정규화된 모양. 다시 불러올 때 바뀌지 않은 표제어는 다시 바꾸지 않습니다.
+        self.conversions = dict()
+        super().__init__(parent.word_class, parent.spreadsheet_key, parent.sheet_number)
+
+        parent.views.append(self)
+        self.data = self.derive_data(parent.data)
+
+    @property
+    def source(self) -> Database:
+        return self.parent.source
+
+    def connect(self):
+        self.parent.connect()
+        self.sheet = self.parent.sheet
+        return self
 
     def reload(self):
-        self.sheet_values = self.sheet.get_all_values()[self.word_class.leading_rows:]
-        for i, sheet_value in enumerate(self.sheet_values):
-            self.sheet_values[i][0] = self.convert_function(sheet_value[0])
-        self.last_reload = datetime.now()
+        self.parent.reload()
         return self
 
+    async def reload_async(self):
+        await self.parent.reload_async()
+        return self
+
+    def load_snapshot(self) -> bool:
+        return self.parent.load_snapshot()
+
+    def build_indexes(self):
+        self.parent.build_indexes()
+
+    def derive_data(self, parent_data: DatabaseData) -> DialectData:
+        """
+        부모 데이터베이스의 자료에서 표제어만 바꾼 자료를 만듭니다.
+        표제어를 바꾸고, 바꾼 표제어에 대한 n-gram 색인, 일치 단어 색인, 비슷한 단어 색인, 접두사 색인만 새로 만듭니다.
+        부모의 자료가 색인 없이 만들어졌다면 n-gram 색인과 비슷한 단어 색인은 만들지 않습니다.
+
+        :param parent_data: 부모 데이터베이스의 자료
+        """
+        column = self.word_class.word_column
+        conversions = dict()
+        headwords, normalised_headwords = list(), list()
+        for row in parent_data.sheet_values:
+            word = row[column]
+            if word not in conversions:
+                conversion = self.conversions.get(word)
+                if conversion is None:
+                    converted = self.convert_function(word)
+                    conversion = converted, normalise(converted)
+                conversions[word] = conversion
+            converted, normalised_converted = conversions[word]
+            headwords.append(converted)
+            normalised_headwords.append(normalised_converted)
+        self.conversions = conversions
+
+        indexed = parent_data.indexed
+        ngram_index = NgramIndex(([headword] for headword in normalised_headwords), self.ngram_size) \
+            if indexed and self.ngram_size else None
+
+        # ``exact_tokens``는 첫 열을 통째로, 나머지 열은 뜻 구분자로 나누어 토큰으로 삼습니다.
+        exact_index = defaultdict(set)
+        for row_id, headword in enumerate(normalised_headwords):
+            for token in (headword,) if column == 0 else MEANING_SEPARATOR.split(headword):
+                exact_index[token].add(row_id)
+
+        fuzzy_index = DeletionIndex(normalised_headwords, self.fuzzy_distance) \
+            if indexed and self.fuzzy_distance else None
+        prefix_index = PrefixIndex(zip(normalised_headwords, headwords))
+
+        return DialectData(parent_data, column, headwords, normalised_headwords, ngram_index, dict(exact_index),
+                           fuzzy_index, prefix_index, self.parent.exact_tokens)
+
 
 class SimpleWord(Word):
+    __slots__ = ('meaning', 'note')
+
     def __init__(self, word: str, meaning: str, note: str = ''):
         super().__init__(word)
         self.meaning = meaning
@@ -128,26 +463,30 @@ class SimpleWord(Word):
 class SimpleDatabase(Database):
     def __init__(self, spreadsheet_key: str, sheet_number: int = 0,
                  word_column: int = 0, meaning_column: int = 1, note_column: int = -1):
-        super().__init__(SimpleWord, spreadsheet_key, sheet_number)
         self.word_column = word_column
         self.meaning_column = meaning_column
         self.note_column = note_column
+        super().__init__(SimpleWord, spreadsheet_key, sheet_number)
+
+    def searchable_columns(self, row: list) -> list:
+        return [row[self.word_column], row[self.meaning_column]]
 
-    def is_duplicate(self, query: str, row: list) -> bool:
-        return normalise(query) == row[self.word_column] \
-               or normalise(query) in re.split(r'[,;] ', normalise(row[self.meaning_column]))
+    def headword(self, row: list) -> str:
+        return row[self.word_column]
 
-    def row_appending(self, rows_list, row):
+    def exact_tokens(self, row: list) -> set:
+        return {normalise(row[self.word_column]), *MEANING_SEPARATOR.split(normalise(row[self.meaning_column]))}
+
+    def make_word(self, row: list) -> Word:
         # noinspection PyArgumentList
-        rows_list.append(self.word_class(
+        return self.word_class(
             row[self.word_column], row[self.meaning_column],
-            '' if self.note_column == -1 else row[self.note_column]))
-
-    async def search_rows(self, query: str) -> Tuple[List[Word], set, bool]:
-        return await search_rows(self, query)
+            '' if self.note_column == -1 else row[self.note_column])
 
 
 class PosWord(Word):
+    __slots__ = ('pos', 'meaning', 'note')
+
     def __init__(self, word: str, pos: str, meaning: str, note: str = ''):
         super().__init__(word)
         self.pos = pos
@@ -165,46 +504,109 @@ class PosWord(Word):
 class PosDatabase(Database):
     def __init__(self, spreadsheet_key: str, sheet_number: int = 0,
                  word_column: int = 0, pos_column: int = 1, meaning_column: int = 2, note_column: int = -1):
-        super().__init__(PosWord, spreadsheet_key, sheet_number)
         self.word_column = word_column
         self.pos_column = pos_column
         self.meaning_column = meaning_column
         self.note_column = note_column
+        super().__init__(PosWord, spreadsheet_key, sheet_number)
+
+    def searchable_columns(self, row: list) -> list:
+        return [row[self.word_column], row[self.meaning_column]]
 
-    def is_duplicate(self, query: str, row: list) -> bool:
-        return normalise(query) == row[self.word_column] \
-               or normalise(query) in re.split(r'[,;] ', normalise(row[self.meaning_column]))
+    def headword(self, row: list) -> str:
+        return row[self.word_column]
 
-    def row_appending(self, rows_list, row):
+    def exact_tokens(self, row: list) -> set:
+        return {normalise(row[self.word_column]), *MEANING_SEPARATOR.split(normalise(row[self.meaning_column]))}
+
+    def make_word(self, row: list) -> Word:
         # noinspection PyArgumentList
-        rows_list.append(self.word_class(
+        return self.word_class(
             row[self.word_column], row[self.pos_column], row[self.meaning_column],
-            '' if self.note_column == -1 else row[self.note_column]))
+            '' if self.note_column == -1 else row[self.note_column])
 
-    async def search_rows(self, query: str) -> Tuple[List[Any], Set[int], bool]:
-        return await search_rows(self, query)
 
+class SearchResult:
+    """
+    검색 결과입니다. 검색어가 들어있는 행의 번호만 가지고 있고, ``Word``는 실제로 보여줄 단어만 ``word``로 만듭니다.
+    """
 
-async def search_rows(database: Union[SimpleDatabase, PosDatabase], query: str):
-    reloaded = False
-    if database.last_reload + timedelta(weeks=1) < datetime.now():
-        database.reload()
-        reloaded = True
+    def __init__(self, database: Database, data: DatabaseData, row_ids: Tuple[int, ...], duplicates: FrozenSet[int]):
+        """
+        :param database: 검색한 데이터베이스
+        :param data: 검색한 데이터
+        :param row_ids: 검색어가 들어있는 행의 번호들
+        :param duplicates: query와 뜻이나 단어 모양이 일치하는 단어 - 중요한 단어의 ``row_ids`` 내 index
+        """
+        self.database = database
+        self.data = data
+        self.row_ids = row_ids
+        self.duplicates = duplicates
+
+    def __len__(self) -> int:
+        return len(self.row_ids)
+
+    def word(self, index: int) -> Word:
+        """ ``index`` 번째 검색 결과의 ``Word``를 만듭니다. """
+        return self.database.make_word(self.data.sheet_values[self.row_ids[index]])
+
+
+async def search_rows(database: Database, query: str) -> SearchResult:
+    data = database.data
+    row_ids, duplicates = await find_rows(database, normalise(query), data)
+    return SearchResult(database, data, row_ids, duplicates)
+
+
+async def find_rows(database: Database, normalised_query: str, data: Optional[DatabaseData] = None) \
+        -> Tuple[Tuple[int, ...], FrozenSet[int]]:
+    """
+    검색 결과를 캐시에서 찾고, 없으면 ``match_rows``로 검색해 캐시에 넣습니다.
+
+    :param database: 검색할 데이터베이스
+    :param normalised_query: 정규화된 검색어
+    :param data: 검색할 데이터. 주어지지 않으면 데이터베이스의 지금 데이터
+    :return: 검색어가 들어있는 행의 번호들, 그 중 일치하는 단어의 index
+    """
+    if data is None:
+        data = database.data
+
+    key = (database, normalised_query)
+    result = search_cache.get(key, data.generation)
+    if result is None:
+        result = await match_rows(data, normalised_query, database.scan_time_budget)
+        search_cache.put(key, data.generation, result)
+    return result
+
+
+async def match_rows(data: DatabaseData, normalised_query: str, time_budget: float = 0.002) \
+        -> Tuple[Tuple[int, ...], FrozenSet[int]]:
+    """
+    행을 훑는 동안 ``time_budget`` 초가 지날 때마다 이벤트 루프에 양보합니다.
+
+    :param data: 검색할 데이터
+    :param normalised_query: 정규화된 검색어
+    :param time_budget: 이벤트 루프에 양보하지 않고 연속으로 훑을 최대 시간(초)
+    :return: 검색어가 들어있는 행의 번호들, 그 중 일치하는 단어의 index
+    """
+    duplicate_ids = data.exact_matches(normalised_query)
     duplicates = set()
     rows = list()
-    for j, row in enumerate(database.sheet_values):
-        await sleep(0)
-        if normalise(query) in normalise(row[database.word_column]) \
-                or normalise(query) in normalise(row[database.meaning_column]):
-            # noinspection PyArgumentList
-            database.row_appending(rows, row)
-        if database.is_duplicate(query, row):
-            duplicates.add(len(rows) - 1)
-    return rows, duplicates, reloaded
+    row_ids, verified = data.candidates(normalised_query)
+    contains = data.contains
+    deadline = perf_counter() + time_budget
+    for i, row_id in enumerate(row_ids):
+        if i % SCAN_CHECK_INTERVAL == 0 and perf_counter() > deadline:
+            await sleep(0)
+            deadline = perf_counter() + time_budget
+        if verified or contains(row_id, normalised_query):
+            rows.append(row_id)
+            if row_id in duplicate_ids:
+                duplicates.add(len(rows) - 1)
+    return tuple(rows), frozenset(duplicates)
 
 
 if __name__ == '__main__':
     from database.zasok import ZasokeseWord
 
-    zasokese_database = Database(ZasokeseWord, 'zasokese_database')
+    zasokese_database = Database(ZasokeseWord, 'zasokese_database').connect()
     zasokese_database.sheet.insert_row(['ariva', '으악', '', '', '', '', '', '선험', ''], index=2)
@@ -0,0 +1,48 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class SearchCache:
+    """
+    데이터베이스 검색 결과를 담아두는 LRU 캐시입니다.
+    결과마다 그 결과를 만든 데이터의 세대를 같이 저장하고, 데이터베이스가 다시 불러와져 세대가 바뀌면 그 결과는 버립니다.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, generation: int) -> Optional[Any]:
+        """
+        :param key: 캐시 키
+        :param generation: 지금 데이터의 세대
+        :return: 저장된 결과. 없거나 다른 세대의 결과라면 ``None``
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != generation:
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, generation: int, value: Any):
+        self.entries[key] = (generation, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -1,7 +1,9 @@
-from database import PosDatabase, PosWord
+from database import Word, PosDatabase, PosWord
 
 
 class EnjieWord(PosWord):
+    __slots__ = ('reading', 'animate', 'vowel', 'accent')
+
     def __init__(self, word: str, pos: str, meaning: str, reading: str, animate: str, vowel: str, accent: str):
         super().__init__(word, pos, meaning)
         self.reading = reading
@@ -33,7 +35,7 @@ class EnjieDatabase(PosDatabase):
         self.vowel_type = 5
         self.accent = 6
 
-    def row_appending(self, rows_list, row):
-        rows_list.append(EnjieWord(
+    def make_word(self, row: list) -> Word:
+        return EnjieWord(
             row[self.word_column], row[self.pos_column], row[self.meaning_column], row[self.reading_column],
-            row[self.animate_noun], row[self.vowel_type], row[self.accent]))
+            row[self.animate_noun], row[self.vowel_type], row[self.accent])
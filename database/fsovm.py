@@ -2,6 +2,8 @@ from database import Word
 
 
 class FsovmWord(Word):
+    __slots__ = ('noun', 'adjective', 'verb', 'postpos', 'interj')
+
     # def __init__(self, word: str, noun: str, adjective: str, verb: str, adverb: str, postpos: str, interj):
     def __init__(self, word: str, noun: str, adjective: str, verb: str, postpos: str, interj):
         super().__init__(word)
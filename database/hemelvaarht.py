@@ -5,6 +5,7 @@ from database import Word
 
 class ThravelemehWord(Word):
     back_slice = 2
+    __slots__ = ('noun', 'verb', 'adj', 'adv', 'conj', 'postpos', 'remark', 'cont', 'origin_language', 'origin')
 
     def __init__(self, word: str, noun: str = '', verb: str = '', adj: str = '', adv: str = '', conj: str = '', postpos: str= '',
                  remark: str = '', cont: str = '', origin_language: str = '', origin: str = ''):
@@ -0,0 +1,231 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+def ngrams(string: str, n: int) -> set:
+    """ 문자열에 들어있는 모든 ``n``-gram을 반환합니다. """
+    return {string[i:i + n] for i in range(len(string) - n + 1)}
+
+
+class NgramIndex:
+    """
+    정규화된 행들에 대한 n-gram 역색인입니다.
+    검색어에 들어있는 모든 n-gram을 가진 행만 후보로 골라, 부분 문자열 검사를 할 행의 수를 줄입니다.
+    """
+
+    def __init__(self, rows: Iterable[Iterable[str]], n: int = 3):
+        """
+        :param rows: 행마다 정규화된 검색 대상 열들의 목록
+        :param n: gram의 길이
+        """
+        self.n = n
+
+        postings = defaultdict(list)
+        for row_id, columns in enumerate(rows):
+            grams = set()
+            for column in columns:
+                grams.update(ngrams(column, n))
+            for gram in grams:
+                postings[gram].append(row_id)
+        self.postings = dict(postings)
+
+    def candidates(self, query: str) -> Optional[List[int]]:
+        """
+        검색어의 모든 n-gram을 포함하는 행의 번호를 오름차순으로 반환합니다.
+        검색어가 gram보다 짧아 색인을 쓸 수 없으면 ``None``을 반환합니다.
+
+        :param query: 정규화된 검색어
+        :return: 후보 행 번호 목록
+        """
+        if len(query) < self.n:
+            return None
+
+        postings = sorted((self.postings.get(gram, ()) for gram in ngrams(query, self.n)), key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result.intersection_update(posting)
+        return sorted(result)
+
+
+class ColumnarText:
+    """
+    행마다 정규화된 검색 대상 열들을 구분 문자로 이어, 전체를 하나의 연속된 문자열로 저장합니다.
+    검색은 ``str.find``로 버퍼 전체를 C 수준에서 훑고, 찾은 위치를 행 번호로 바꾸기만 하므로 행마다 파이썬 반복을 돌지 않습니다.
+    """
+
+    SEPARATOR = '\x00'
+
+    def __init__(self, rows: Iterable[Iterable[str]]):
+        """
+        :param rows: 행마다 정규화된 검색 대상 열들의 목록
+        """
+        parts = list()
+        self.offsets = list()
+        position = 0
+        for columns in rows:
+            self.offsets.append(position)
+            part = self.SEPARATOR.join(columns) + self.SEPARATOR
+            parts.append(part)
+            position += len(part)
+        self.text = ''.join(parts)
+
+    def matches(self, query: str) -> Optional[Iterator[int]]:
+        """
+        :param query: 정규화된 검색어
+        :return: 검색어가 들어있는 행의 번호를 오름차순으로 내는 이터레이터. 검색어가 비었거나 구분 문자를 포함하면 ``None``
+        """
+        if not query or self.SEPARATOR in query:
+            return None
+        return self.iterate_matches(query)
+
+    def iterate_matches(self, query: str) -> Iterator[int]:
+        text, offsets = self.text, self.offsets
+        position = text.find(query)
+        while position != -1:
+            row_id = bisect_right(offsets, position) - 1
+            yield row_id
+            if row_id + 1 == len(offsets):
+                break
+            position = text.find(query, offsets[row_id + 1])
+
+
+# 단어 길이별로 찾을 최대 편집 거리. 길이가 이 값 이하이면 그 거리까지만 찾고, 더 긴 단어는 색인의 최대 편집 거리까지 찾습니다.
+DISTANCE_BY_LENGTH = ((2, 0), (4, 1))
+
+
+def distance_for_length(length: int, max_distance: int) -> int:
+    """ 길이가 ``length``인 단어에서 찾을 편집 거리를 반환합니다. 짧은 단어는 몇 글자만 바꿔도 전혀 다른 단어가 되므로 거리를 줄입니다. """
+    for max_length, distance in DISTANCE_BY_LENGTH:
+        if length <= max_length:
+            return min(distance, max_distance)
+    return max_distance
+
+
+def deletions(string: str, distance: int) -> set:
+    """ 문자열에서 글자를 ``distance`` 개 이하로 지워 만들 수 있는 모든 문자열을 반환합니다. """
+    result = {string}
+    frontier = {string}
+    for _ in range(distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        result.update(frontier)
+    return result
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    두 문자열의 편집 거리(인접한 두 글자를 바꾸는 것도 한 번으로 셈)를 반환합니다.
+    거리가 ``limit``보다 크면 계산을 멈추고 ``limit + 1``을 반환합니다.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+class DeletionIndex:
+    """
+    SymSpell 방식의 삭제 이웃 색인입니다.
+    표제어마다 앞 ``prefix_length`` 글자에서 ``max_distance`` 글자 이하를 지운 문자열들을 미리 색인해두고,
+    검색어에도 같은 일을 해 겹치는 표제어만 편집 거리를 계산합니다.
+    찾는 편집 거리는 ``distance_for_length``에 따라 검색어와 표제어 중 짧은 쪽의 길이로 정해지므로,
+    짧은 표제어는 지운 문자열을 적게 만들고 짧은 검색어는 후보를 적게 봅니다.
+    """
+
+    def __init__(self, words: Iterable[str], max_distance: int = 2, prefix_length: int = 6):
+        """
+        :param words: 행마다 정규화된 표제어
+        :param max_distance: 찾을 최대 편집 거리
+        :param prefix_length: 삭제 이웃을 만들 표제어 앞부분의 길이
+        """
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+
+        self.words = list()
+        # 대부분의 지운 문자열은 표제어 하나에서만 나오므로, 행이 하나뿐이면 리스트 대신 행 번호만 저장해 메모리를 아낍니다.
+        self.postings: Dict[str, Union[int, List[int]]] = dict()
+        for row_id, word in enumerate(words):
+            self.words.append(word)
+            if not word:
+                continue
+            for deletion in deletions(word[:prefix_length], distance_for_length(len(word), max_distance)):
+                row_ids = self.postings.get(deletion)
+                if row_ids is None:
+                    self.postings[deletion] = row_id
+                elif isinstance(row_ids, int):
+                    self.postings[deletion] = [row_ids, row_id]
+                else:
+                    row_ids.append(row_id)
+
+    def lookup(self, query: str, max_distance: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        :param query: 정규화된 검색어
+        :param max_distance: 찾을 최대 편집 거리. 주어지지 않으면 색인을 만들 때의 값
+        :return: 편집 거리가 ``max_distance`` 이하이면서 검색어와 표제어의 길이로 정해지는 거리 이하인 행의 번호와 그 거리.
+            거리가 가까운 순서
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        max_distance = distance_for_length(len(query), max_distance)
+        if not query:
+            return list()
+
+        candidates = set()
+        for deletion in deletions(query[:self.prefix_length], max_distance):
+            row_ids = self.postings.get(deletion)
+            if row_ids is None:
+                continue
+            if isinstance(row_ids, int):
+                candidates.add(row_ids)
+            else:
+                candidates.update(row_ids)
+
+        result = list()
+        for row_id in candidates:
+            word = self.words[row_id]
+            if abs(len(word) - len(query)) > max_distance:
+                continue
+            limit = distance_for_length(len(word), max_distance)
+            distance = edit_distance(query, word, limit)
+            if distance <= limit:
+                result.append((row_id, distance))
+        result.sort(key=lambda x: (x[1], x[0]))
+        return result
+
+
+class PrefixIndex:
+    """ 정규화된 표제어를 정렬해두고, 이분 탐색으로 주어진 접두사로 시작하는 표제어를 찾습니다. """
+
+    def __init__(self, words: Iterable[Tuple[str, str]]):
+        """
+        :param words: 정규화된 표제어와 원래 표제어
+        """
+        self.entries = sorted({(normalised, word) for normalised, word in words if normalised})
+        self.keys = [normalised for normalised, _ in self.entries]
+
+    def complete(self, prefix: str, limit: int = 25) -> List[str]:
+        """
+        :param prefix: 정규화된 접두사
+        :param limit: 반환할 표제어의 최대 개수
+        :return: ``prefix``로 시작하는 원래 표제어. 정규화된 표제어의 사전 순서
+        """
+        result = list()
+        for i in range(bisect_left(self.keys, prefix), len(self.keys)):
+            if len(result) >= limit or not self.keys[i].startswith(prefix):
+                break
+            if self.entries[i][1] not in result:
+                result.append(self.entries[i][1])
+        return result
@@ -4,6 +4,8 @@ from database import Word
 
 
 class IremnaWord(Word):
+    __slots__ = ('cells',)
+
     def __init__(self, *cells: str):
         super().__init__(cells[0])
         self.cells = cells
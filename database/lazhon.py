@@ -2,6 +2,8 @@ from database import Word
 
 
 class LazhonWord(Word):
+    __slots__ = ('noun', 'verb', 'adjective', 'adverb', 'postpos', 'conjuction', 'others', 'note')
+
     def __init__(self, word: str, noun: str, verb: str, adjective: str, adverb: str, postpos: str, conjuction: str, others: str, note: str, yuynyny: str, yuyn: str):
         super().__init__(word)
         self.noun = noun
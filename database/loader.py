@@ -0,0 +1,66 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from time import monotonic
+from typing import Dict
+
+from database.basis import Database
+
+
+def load_database(database: Database) -> float:
+    """
+    디스크에 저장된 값으로 만든 자료라면 먼저 색인을 만들고, 데이터베이스를 시트에 연결해 값을 불러온 뒤,
+    시트에서 불러오는 데 걸린 시간을 초 단위로 반환합니다.
+    """
+    database.build_indexes()
+    start = monotonic()
+    database.connect()
+    database.reload()
+    return monotonic() - start
+
+
+def load_databases(databases: Dict[str, Database], max_workers: int = 4) -> Dict[str, Future]:
+    """
+    모든 데이터베이스를 불러옵니다.
+
+    디스크에 저장된 값이 있는 데이터베이스는 그 값으로 색인 없이 곧바로 검색할 수 있게 하고,
+    색인을 만드는 일과 시트에서 다시 불러오는 일은 뒤에서 동시에 진행합니다.
+    저장된 값이 없는 데이터베이스는 시트에서 불러올 때까지 기다립니다.
+    뒤에서 다시 불러오다 실패하면 저장된 값으로 만든 자료를 계속 씁니다.
+    파생 데이터베이스는 따로 불러오지 않고, 부모 데이터베이스를 불러올 때 함께 만들어집니다.
+
+    :param databases: 이름과 데이터베이스
+    :param max_workers: 동시에 불러올 데이터베이스의 최대 개수
+    :return: 데이터베이스 이름별로, 시트에서 불러오는 데 걸린 시간(초)을 결과로 갖는 ``Future``
+    """
+    print(f'Loading {len(databases)} dictionaries ...')
+    start = monotonic()
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='database-loader')
+    futures = dict()
+    source_futures = dict()
+    cold_names = list()
+    for name, database in databases.items():
+        source = database.source
+        if source not in source_futures:
+            if source.load_snapshot():
+                print(f'Dictionary `{name}` loaded from snapshot.')
+            else:
+                cold_names.append(name)
+            source_futures[source] = executor.submit(load_database, source)
+
+        futures[name] = source_futures[source]
+        futures[name].add_done_callback(partial(report_loading, name))
+    executor.shutdown(wait=False)
+
+    for name in cold_names:
+        futures[name].result()
+
+    print(f'All dictionaries loaded. ({monotonic() - start:.2f}s)')
+    return futures
+
+
+def report_loading(name: str, future: Future):
+    if future.exception() is None:
+        print(f'Dictionary `{name}` loaded from sheet. ({future.result():.2f}s)')
+    else:
+        print(f'Failed to load dictionary `{name}` from sheet: {future.exception()!r}')
@@ -2,6 +2,8 @@ from database import Word
 
 
 class MikhorosWord(Word):
+    __slots__ = ('id', 'noun', 'verb', 'etc')
+
     def __init__(self, word: str, id_: str = '', noun: str = '', verb: str = '', etc: str = ''):
         super().__init__(word)
         self.id = id_
@@ -3,6 +3,8 @@ from database import Word
 
 class PaselWord(Word):
     back_slice = 2
+    word_column = 1
+    __slots__ = ('code', 'noun', 'verb', 'adj', 'etc', 'note', 'derived_from_language', 'derived_from_word')
 
     def __init__(self, code: str = '', word: str = '', noun: str = '', verb: str = '', adj: str = '', etc: str = '',
                  note: str = '', derived_from_language: str = '', derived_from_word: str = ''):
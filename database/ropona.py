@@ -3,6 +3,9 @@ from database import Word, PosDatabase
 
 class RoponaWord(Word):
     back_slice = 2
+    __slots__ = (
+        "pronunciation_modern", "pronunciation_middle", "pronunciation_old", "pronunciation_hyper", "pos", "meaning",
+        "accent", "traditional")
 
     def __init__(
         self,
@@ -48,17 +51,15 @@ class RoponaDatabase(PosDatabase):
         self.accent_column = 7
         self.traditional_column = 8
 
-    def row_appending(self, rows_list, row):
-        rows_list.append(
-            RoponaWord(
-                row[self.word_column],
-                row[self.pronunciation_modern_column],
-                row[self.pronunciation_middle_column],
-                row[self.pronunciation_old_column],
-                row[self.pronunciation_hyper_column],
-                row[self.pos_column],
-                row[self.meaning_column],
-                row[self.accent_column],
-                row[self.traditional_column],
-            )
+    def make_word(self, row: list) -> Word:
+        return RoponaWord(
+            row[self.word_column],
+            row[self.pronunciation_modern_column],
+            row[self.pronunciation_middle_column],
+            row[self.pronunciation_old_column],
+            row[self.pronunciation_hyper_column],
+            row[self.pos_column],
+            row[self.meaning_column],
+            row[self.accent_column],
+            row[self.traditional_column],
         )
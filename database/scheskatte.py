@@ -2,6 +2,8 @@ from database import Word
 
 
 class ScheskatteWord(Word):
+    __slots__ = ('noun', 'adj', 'verb', 'adv', 'prep', 'remark', 'derived_from_language', 'derived_from_word')
+
     def __init__(self, word: str, noun: str = '', adj: str = '', verb: str = '', adv: str = '', prep: str = '',
                     remark: str = '', derived_from_language: str = '', derived_from_word: str = ''):
         super().__init__(word)
@@ -2,6 +2,8 @@ from database import Word
 
 
 class SesameWord(Word):
+    __slots__ = ('pronunciation', 'origin', 'object', 'action', 'property', 'target', 'notes')
+
     def __init__(self, word: str, pronunciation: str, origin: str, object_: str, action: str, property_: str, target: str,
                  *notes: str):
         super().__init__(word)
@@ -0,0 +1,110 @@
+from collections import defaultdict
+from threading import Lock
+from time import monotonic, sleep
+from typing import Callable, Collection, Dict, List, Optional
+
+import gspread
+from gspread.exceptions import APIError
+
+from const import get_const
+
+CREDENTIALS_PATH = 'res/google_credentials.json'
+# 모든 스레드를 합쳐 분당 보낼 Google Sheets API 요청의 최대 개수
+REQUESTS_PER_MINUTE = 60
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503)
+
+client: Optional[gspread.Client] = None
+spreadsheets: Dict[str, gspread.Spreadsheet] = dict()
+# 스프레드시트별로, 그 안의 워크시트들
+worksheets: Dict[str, List[gspread.Worksheet]] = dict()
+
+lock = Lock()
+spreadsheet_locks: Dict[str, Lock] = defaultdict(Lock)
+
+
+class RequestPacer:
+    """ Google Sheets API 요청 사이에 간격을 두어, 여러 스레드가 함께 요청해도 분당 요청 한도를 넘지 않게 합니다. """
+
+    def __init__(self, requests_per_minute: int = REQUESTS_PER_MINUTE):
+        self.interval = 60 / requests_per_minute
+        self.next_time = 0.0
+        self.lock = Lock()
+
+    def wait(self):
+        """ 다음 요청을 보내도 되는 시각까지 기다립니다. """
+        with self.lock:
+            now = monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0:
+            sleep(delay)
+
+
+# 시작할 때 불러오는 일, 주기적으로 다시 불러오는 일, 행을 추가하는 일이 모두 이 간격을 함께 지킵니다.
+pacer = RequestPacer()
+
+
+def call_paced(function: Callable, retries: int = 5,
+               retryable_status_codes: Collection[int] = RETRYABLE_STATUS_CODES):
+    """
+    ``pacer``에 맞추어 ``function``을 호출합니다.
+    요청 한도 초과나 일시적인 서버 오류가 나면 간격을 늘려가며 다시 시도합니다.
+
+    :param retryable_status_codes: 다시 시도할 응답 상태 코드.
+        서버 오류가 나도 실제로는 반영되었을 수 있는 쓰기 요청이라면 429만 주어야 합니다.
+    """
+    for attempt in range(retries):
+        pacer.wait()
+        try:
+            return function()
+        except APIError as e:
+            if attempt == retries - 1 or e.response.status_code not in retryable_status_codes:
+                raise
+            sleep(2 ** attempt)
+
+
+def get_client() -> gspread.Client:
+    """
+    프로세스 전체가 함께 쓰는 Google Sheets 클라이언트를 반환합니다.
+    인증은 처음 한 번만 하고, 이후의 모든 요청은 같은 HTTP 세션의 연결을 재사용합니다.
+    """
+    global client
+
+    with lock:
+        if client is None:
+            client = gspread.service_account(filename=CREDENTIALS_PATH)
+        return client
+
+
+def get_spreadsheet(spreadsheet_key: str) -> gspread.Spreadsheet:
+    """
+    ``spreadsheet_key`` const에 해당하는 스프레드시트를 반환합니다.
+    같은 스프레드시트는 한 번만 열고, 그 핸들을 모든 데이터베이스가 함께 씁니다.
+
+    :param spreadsheet_key: 스프레드시트 ID가 저장된 const의 키
+    """
+    with lock:
+        spreadsheet_lock = spreadsheet_locks[spreadsheet_key]
+
+    with spreadsheet_lock:
+        if spreadsheet_key not in spreadsheets:
+            spreadsheets[spreadsheet_key] = call_paced(
+                lambda: get_client().open_by_key(get_const(spreadsheet_key)))
+        return spreadsheets[spreadsheet_key]
+
+
+def get_worksheet(spreadsheet_key: str, sheet_number: int) -> gspread.Worksheet:
+    """
+    ``spreadsheet_key`` const에 해당하는 스프레드시트의 ``sheet_number``번째 워크시트를 반환합니다.
+    ``gspread.Spreadsheet.get_worksheet``는 부를 때마다 요청을 보내므로, 워크시트 목록은 스프레드시트마다 한 번만 받아둡니다.
+    이미 받아둔 워크시트라면 요청을 보내지 않습니다.
+    """
+    spreadsheet = get_spreadsheet(spreadsheet_key)
+    with spreadsheet_locks[spreadsheet_key]:
+        if spreadsheet_key not in worksheets:
+            worksheets[spreadsheet_key] = call_paced(spreadsheet.worksheets)
+        sheets = worksheets[spreadsheet_key]
+
+    if not 0 <= sheet_number < len(sheets):
+        raise gspread.WorksheetNotFound(f'index {sheet_number} not found')
+    return sheets[sheet_number]
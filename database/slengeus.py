@@ -3,6 +3,8 @@ from database import Word
 
 class SlengeusWord(Word):
     back_slice = 4
+    word_column = 1
+    __slots__ = ('code', 'noun', 'verb', 'adj', 'adv', 'note', 'etymology')
 
     def __init__(self, code: int, word: str, noun='', verb='', adj='', adv='', note='', etymology='', *_):
         super().__init__(word)
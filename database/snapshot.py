@@ -0,0 +1,36 @@
+import os
+import pickle
+from datetime import datetime
+from threading import get_ident
+from typing import List, Optional, Tuple
+
+SNAPSHOT_DIRECTORY = 'cache/snapshots'
+
+
+def get_snapshot_path(spreadsheet_key: str, sheet_number: int) -> str:
+    return os.path.join(SNAPSHOT_DIRECTORY, f'{spreadsheet_key}-{sheet_number}.pickle')
+
+
+def save_snapshot(path: str, sheet_values: List[List[str]]):
+    """
+    시트 값을 지금 시각과 함께 저장합니다.
+    임시 파일에 쓴 뒤 바꿔치기하므로, 같은 시트를 쓰는 데이터베이스가 동시에 저장해도 파일이 깨지지 않습니다.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary_path = f'{path}.{os.getpid()}-{get_ident()}.tmp'
+    with open(temporary_path, 'wb') as file:
+        pickle.dump((datetime.now(), sheet_values), file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, path)
+
+
+def load_snapshot(path: str) -> Optional[Tuple[datetime, List[List[str]]]]:
+    """
+    저장해둔 시트 값을 불러옵니다.
+
+    :return: 저장한 시각과 시트 값. 저장된 값이 없거나 읽을 수 없으면 ``None``
+    """
+    try:
+        with open(path, 'rb') as file:
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
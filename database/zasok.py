@@ -3,6 +3,10 @@ from database import Word
 
 class ZasokeseWord(Word):
     back_slice = 2
+    word_column = 1
+    __slots__ = (
+        'code', 'frequency', 'noun', 'adj', 'verb', 'adv', 'prep', 'remark', 'derived_from_language',
+        'derived_from_word')
 
     def __init__(self, code: str = '', word: str = '', frequency: str = '', noun: str = '', adj: str = '', verb: str = '',
                  adv: str = '', prep: str = '', remark: str = '', derived_from_language: str = '',
@@ -41,6 +45,8 @@ class ZasokeseWord(Word):
 
 
 class BerquamWord(Word):
+    __slots__ = ('noun', 'adj', 'verb', 'adv', 'remark')
+
     def __init__(self, word: str, noun: str = '', adj: str = '', verb: str = '', adv: str = '', remark: str = ''):
         super().__init__(word)
         self.word = word
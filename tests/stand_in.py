@@ -0,0 +1,72 @@
+from asyncio import IncompleteReadError, StreamReader, StreamWriter, TimeoutError, start_server, wait_for
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+# (메서드, 경로, 본문)을 받아 (상태 코드, 본문)을 돌려주는 함수
+Responder = Callable[[str, str, bytes], Awaitable[Tuple[int, bytes]]]
+
+
+class StandInServer:
+    """
+    테스트에서 외부 API 대신 쓰는 HTTP/1.1 서버입니다. 연결을 유지하며, ``idle_timeout``초 동안 요청이 없으면 연결을 닫습니다.
+    받은 요청, 연 연결 수, 동시에 처리한 최대 요청 수를 기록합니다.
+    """
+
+    def __init__(self, respond: Responder, idle_timeout: Optional[float] = None):
+        self.respond = respond
+        self.idle_timeout = idle_timeout
+
+        self.requests: List[Tuple[str, str, bytes]] = list()
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self.server = None
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}'
+
+    async def __aenter__(self):
+        self.server = await start_server(self.handle, '127.0.0.1', 0)
+        return self
+
+    async def __aexit__(self, *_):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader: StreamReader, writer: StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    request_line = await wait_for(reader.readline(), self.idle_timeout)
+                except TimeoutError:
+                    break
+                if not request_line:
+                    break
+
+                headers = dict()
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, value = line.decode().split(':', 1)
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                method, target, _ = request_line.decode().split(' ', 2)
+                self.requests.append((method, target, body))
+
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                try:
+                    status, content = await self.respond(method, target, body)
+                finally:
+                    self.active -= 1
+
+                writer.write(f'HTTP/1.1 {status} Stand-in\r\n'
+                             f'Content-Type: application/json; charset=utf-8\r\n'
+                             f'Content-Length: {len(content)}\r\n\r\n'.encode() + content)
+                await writer.drain()
+        except (ConnectionError, IncompleteReadError):
+            pass
+        finally:
+            writer.close()
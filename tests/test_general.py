@@ -0,0 +1,32 @@
+import sys
+from random import Random
+
+from util.general import DIACRITIC_TABLE, normalise, normalise_by_category
+
+# 흔히 쓰이는 글자들과, 분해하거나 대소문자를 바꾸면 모양이 달라지는 글자들
+INTERESTING_CHARACTERS = (
+    'aeiouxyzAEIOU ,.-' + 'áàâäãåéèêëíìîïóòôöõúùûüýÿčšžñçÁÀÂÄÉÈÊËÍÎÏÓÔÖÚÛÜČŠŽÑ' + 'ǅǈǋǲẞßİıŉǰ'
+    + '̸̧̀́̂̈᪰⃐ͅ' + '가힣각자소크' + 'ἀἄᾳΩωАЙйё' + 'ﬁ①Ⅻ'
+)
+
+
+def test_every_character():
+    mismatches = [code for code in range(sys.maxunicode + 1)
+                  if not 0xD800 <= code < 0xE000 and normalise(chr(code)) != normalise_by_category(chr(code))]
+    assert not mismatches, [hex(code) for code in mismatches[:10]]
+
+
+def test_table_characters_in_context():
+    # 변환표에 있는 글자 뒤에 결합 부호가 오면, 분해할 때 부호의 순서가 바뀔 수 있습니다.
+    marks = '̧̀́̈ͅ'
+    for code in DIACRITIC_TABLE:
+        for mark in marks:
+            string = f'a{chr(code)}{mark}Z'
+            assert normalise(string) == normalise_by_category(string), repr(string)
+
+
+def test_random_strings():
+    random = Random(19)
+    for _ in range(100000):
+        string = ''.join(random.choice(INTERESTING_CHARACTERS) for _ in range(random.randint(0, 12)))
+        assert normalise(string) == normalise_by_category(string), repr(string)
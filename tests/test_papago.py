@@ -0,0 +1,101 @@
+import json
+from asyncio import gather, run, sleep
+from urllib.parse import parse_qs
+
+import pytest
+
+from tests.stand_in import StandInServer
+from util.papago import PapagoClient, PapagoError
+
+
+def translation(body: bytes) -> bytes:
+    text = parse_qs(body.decode())['text'][0]
+    return json.dumps({'message': {'result': {'translatedText': text.upper()}}}).encode()
+
+
+async def respond_translation(_method: str, _path: str, body: bytes):
+    return 200, translation(body)
+
+
+def make_client(server: StandInServer, tmp_path, **kwargs) -> PapagoClient:
+    return PapagoClient('id', 'secret', url=server.url, cache_path=str(tmp_path / 'papago.sqlite3'), **kwargs)
+
+
+def test_cache_hit(tmp_path):
+    async def main():
+        async with StandInServer(respond_translation) as server:
+            client = make_client(server, tmp_path)
+            assert await client.translate('annyeong', 'ko', 'en') == 'ANNYEONG'
+            assert await client.translate('annyeong', 'ko', 'en') == 'ANNYEONG'
+            assert await client.translate('annyeong', 'ko', 'ja') == 'ANNYEONG'
+            await client.close()
+            assert len(server.requests) == 2
+
+            # 재시작해도 디스크의 캐시에서 돌려줍니다.
+            client = make_client(server, tmp_path)
+            assert await client.translate('annyeong', 'ko', 'en') == 'ANNYEONG'
+            await client.close()
+            assert len(server.requests) == 2
+
+    run(main())
+
+
+def test_connection_error(tmp_path):
+    async def main():
+        async with StandInServer(respond_translation) as server:
+            client = make_client(server, tmp_path)
+        with pytest.raises(PapagoError):
+            await client.translate('annyeong', 'ko', 'en')
+        await client.close()
+
+    run(main())
+
+
+def test_error_response(tmp_path):
+    async def respond_error(_method: str, _path: str, _body: bytes):
+        return 500, b'{"errorMessage": "internal error"}'
+
+    async def main():
+        async with StandInServer(respond_error) as server:
+            client = make_client(server, tmp_path)
+            with pytest.raises(PapagoError):
+                await client.translate('annyeong', 'ko', 'en')
+            # 실패한 번역은 캐시하지 않습니다.
+            with pytest.raises(PapagoError):
+                await client.translate('annyeong', 'ko', 'en')
+            await client.close()
+            assert len(server.requests) == 2
+
+    run(main())
+
+
+def test_malformed_response(tmp_path):
+    async def respond_malformed(_method: str, _path: str, _body: bytes):
+        return 200, b'{"message": {}}'
+
+    async def main():
+        async with StandInServer(respond_malformed) as server:
+            client = make_client(server, tmp_path)
+            with pytest.raises(PapagoError):
+                await client.translate('annyeong', 'ko', 'en')
+            await client.close()
+
+    run(main())
+
+
+def test_bounded_concurrency(tmp_path):
+    async def respond_slowly(method: str, path: str, body: bytes):
+        await sleep(0.05)
+        return await respond_translation(method, path, body)
+
+    async def main():
+        async with StandInServer(respond_slowly) as server:
+            client = make_client(server, tmp_path, max_concurrent_requests=2)
+            results = await gather(*(client.translate(f'word{i}', 'ko', 'en') for i in range(10)))
+            await client.close()
+            assert results == [f'WORD{i}' for i in range(10)]
+            assert len(server.requests) == 10
+            assert server.max_active == 2
+            assert server.connections <= 2
+
+    run(main())
@@ -0,0 +1,104 @@
+import pytest
+from gspread.exceptions import APIError
+
+from database import sheets
+from database.sheets import RequestPacer, call_paced, get_worksheet
+
+
+class StandInResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.text = '{}'
+
+    def json(self) -> dict:
+        return {'error': {'code': self.status_code, 'message': 'error', 'status': 'ERROR'}}
+
+
+def failing(status_codes: list):
+    """ ``status_codes``의 상태 코드로 차례로 실패한 뒤 성공하는 함수와, 호출 횟수를 세는 목록을 반환합니다. """
+    calls = list()
+
+    def function():
+        calls.append(None)
+        if len(calls) <= len(status_codes):
+            raise APIError(StandInResponse(status_codes[len(calls) - 1]))
+        return 'ok'
+
+    return function, calls
+
+
+class Clock:
+    """ ``sleep``하면 그만큼 시간이 흐르는 가짜 시계입니다. """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = list()
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(sheets, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(sheets, 'sleep', clock.sleep)
+    monkeypatch.setattr(sheets, 'pacer', RequestPacer(60))
+    return clock
+
+
+def test_pacing(clock: Clock):
+    for _ in range(3):
+        call_paced(lambda: None)
+    assert clock.sleeps == [1, 1]
+
+
+def test_retry(clock: Clock):
+    function, calls = failing([429, 503])
+    assert call_paced(function) == 'ok'
+    assert len(calls) == 3
+    # 다시 시도하기 전에 기다리는 동안 요청 간격도 지나갑니다.
+    assert clock.sleeps == [1, 2]
+
+
+@pytest.mark.parametrize('status_code, retryable_status_codes', [(404, sheets.RETRYABLE_STATUS_CODES), (500, (429,))])
+def test_no_retry(status_code: int, retryable_status_codes: tuple):
+    function, calls = failing([status_code])
+    with pytest.raises(APIError):
+        call_paced(function, retryable_status_codes=retryable_status_codes)
+    assert len(calls) == 1
+
+
+def test_give_up():
+    function, calls = failing([429] * 5)
+    with pytest.raises(APIError):
+        call_paced(function)
+    assert len(calls) == 5
+
+
+def test_worksheets_are_fetched_once(monkeypatch, clock: Clock):
+    class StandInSpreadsheet:
+        def __init__(self):
+            self.requests = 0
+
+        def worksheets(self):
+            self.requests += 1
+            return ['first', 'second']
+
+    spreadsheet = StandInSpreadsheet()
+    monkeypatch.setattr(sheets, 'spreadsheets', {'key': spreadsheet})
+    monkeypatch.setattr(sheets, 'worksheets', dict())
+
+    # 이미 받아둔 워크시트는 요청 한도를 쓰지 않습니다.
+    call_paced(lambda: None)
+    assert get_worksheet('key', 1) == 'second'
+    assert get_worksheet('key', 0) == 'first'
+    with pytest.raises(sheets.gspread.WorksheetNotFound):
+        get_worksheet('key', 2)
+    call_paced(lambda: None)
+    assert spreadsheet.requests == 1
+    assert clock.sleeps == [1, 1]
@@ -0,0 +1,107 @@
+from random import Random
+
+import pytest
+
+from util.general import normalise
+from util.simetasis import zasokese_to_simetasise, zasokese_to_simetasise_all
+
+# 규칙에 쓰이는 글자, 대문자, 결합 부호, 끝에서 떼어내는 문장 부호, 그리고 그 밖의 글자
+ALPHABET = 'xyjÿcäëïöüêéèâîqusheiaogdvbtpkr' + 'XYJCQUSÊÄ' + '̀́̂̈' + '.,;:?!"\']' + '가z-'
+
+
+def zasokese_to_simetasise_by_replace(sentence: str) -> str:
+    """ ``zasokese_to_simetasise``의 원래 구현입니다. 규칙을 차례로 ``str.replace``로 적용합니다. """
+
+    result = ''
+    words = sentence.split(' ')
+    for word in words:
+        if not word:
+            continue
+
+        punctuation = ''
+        while word[-1] in '.,;:?!\"\']':
+            punctuation = word[-1] + punctuation
+            word = word[:-1]
+
+        if word.startswith('ex'):
+            word = word[1:]
+        elif word.startswith('êx'):
+            word = 'e' + word[1:]
+        word = word.replace('x', 'sh')
+        word = word.replace('y', 'ú').replace('j', 'y').replace('ÿ', 'yú')
+        word = word.replace('c', 'ch')
+
+        if word.endswith('que'):
+            word = word[:-3] + 'c'
+        if word.endswith('iê'):
+            word = word[:-1] + 'ee'
+        if word.endswith('g'):
+            word = word[:-1] + 'c'
+        if word.endswith('d'):
+            word = word[:-1] + 't'
+        if word.endswith('v'):
+            word = word[:-1] + 'p'
+        if word.endswith('s'):
+            word = word[:-1] + 'ch'
+        word = word\
+            .replace('ä', 'ae') \
+            .replace('ë', 'ee') \
+            .replace('ï', 'ie') \
+            .replace('ö', 'oe') \
+            .replace('ü', 'ue')
+        word = normalise(word)
+        word = word\
+            .replace('qua', 'ca') \
+            .replace('que', 'ke') \
+            .replace('qui', 'ki') \
+            .replace('quo', 'co')
+        word = word.replace('sh', 'z')
+        word = word.replace('v', 'b')
+
+        word += punctuation
+        result += word + ' '
+    return result.rstrip()
+
+
+def random_sentence(random: Random) -> str:
+    words = [''.join(random.choice(ALPHABET) for _ in range(random.randint(1, 8))) for _ in range(random.randint(1, 3))]
+    return ' ' * random.randint(0, 1) + ' '.join(words)
+
+
+@pytest.mark.parametrize('sentence', [
+    'ex', 'exque', 'êxiê', 'xyjÿc', 'äëïöü', 'quaquequiquo', 'shv', 'vads', 'gàg', 'iê.', 'word?!"', 'ex  x',
+    'Xavier', 'QUE', 'éx', 'zastravapera', '',
+])
+def test_examples(sentence: str):
+    assert zasokese_to_simetasise(sentence) == zasokese_to_simetasise_by_replace(sentence)
+
+
+def test_differential():
+    random = Random(18)
+    sentences = [random_sentence(random) for _ in range(100000)]
+
+    converted = 0
+    for sentence in sentences:
+        try:
+            expected = zasokese_to_simetasise_by_replace(sentence)
+        except IndexError:
+            # 문장 부호로만 이루어진 단어는 원래 구현도 처리하지 못합니다.
+            with pytest.raises(IndexError):
+                zasokese_to_simetasise(sentence)
+            continue
+
+        assert zasokese_to_simetasise(sentence) == expected, sentence
+        converted += 1
+    assert converted > len(sentences) // 2
+
+    valid = [sentence for sentence in sentences if not any(word and not word.strip('.,;:?!"\']')
+                                                            for word in sentence.split(' '))]
+    assert zasokese_to_simetasise_all(valid) == list(map(zasokese_to_simetasise_by_replace, valid))
+
+
+@pytest.mark.parametrize('sentence', ['...', 'word !?', '" \''])
+def test_punctuation_words(sentence: str):
+    with pytest.raises(IndexError):
+        zasokese_to_simetasise_by_replace(sentence)
+    with pytest.raises(IndexError):
+        zasokese_to_simetasise(sentence)
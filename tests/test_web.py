@@ -0,0 +1,103 @@
+from asyncio import gather, run, sleep
+
+import pytest
+
+from tests.stand_in import StandInServer
+from util.web import CachedSession, PooledSession, WebError
+
+
+async def respond_path(_method: str, path: str, _body: bytes):
+    return 200, f'{{"path": "{path}"}}'.encode()
+
+
+def test_cache_hit_and_coalescing():
+    async def respond_slowly(method: str, path: str, body: bytes):
+        await sleep(0.05)
+        return await respond_path(method, path, body)
+
+    async def main():
+        async with StandInServer(respond_slowly) as server:
+            session = CachedSession()
+            responses = await gather(*(session.get(server.url + '/search', params={'q': 'a'}) for _ in range(20)))
+            assert {response.json()['path'] for response in responses} == {'/search?q=a'}
+            assert (await session.get(server.url + '/search', params={'q': 'a'})).status_code == 200
+            await session.get(server.url + '/search', params={'q': 'b'})
+            await session.close()
+            assert len(server.requests) == 2
+
+    run(main())
+
+
+def test_error_response_is_not_cached():
+    async def respond_error(_method: str, _path: str, _body: bytes):
+        return 503, b'{}'
+
+    async def main():
+        async with StandInServer(respond_error) as server:
+            session = CachedSession()
+            assert (await session.get(server.url)).status_code == 503
+            assert (await session.get(server.url)).status_code == 503
+            await session.close()
+            assert len(server.requests) == 2
+
+    run(main())
+
+
+def test_timeout():
+    async def respond_slowly(method: str, path: str, body: bytes):
+        await sleep(1)
+        return await respond_path(method, path, body)
+
+    async def main():
+        async with StandInServer(respond_slowly) as server:
+            session = PooledSession(timeout=0.2)
+            with pytest.raises(WebError):
+                await session.request('GET', server.url)
+            await session.close()
+
+    run(main())
+
+
+def test_connection_refused():
+    async def main():
+        async with StandInServer(respond_path) as server:
+            url = server.url
+        session = PooledSession()
+        with pytest.raises(WebError):
+            await session.request('GET', url)
+        await session.close()
+
+    run(main())
+
+
+@pytest.mark.parametrize('method', ['GET', 'POST'])
+def test_reuse_after_idle_close(method: str):
+    async def main():
+        async with StandInServer(respond_path, idle_timeout=0.3) as server:
+            session = PooledSession()
+            assert (await session.request(method, server.url + '/first')).status_code == 200
+            await sleep(0.6)
+            # 서버가 쉬는 연결을 닫은 뒤에도 요청할 수 있어야 합니다.
+            assert (await session.request(method, server.url + '/second')).status_code == 200
+            assert (await session.request(method, server.url + '/third')).json() == {'path': '/third'}
+            await session.close()
+            assert server.connections == 2
+
+    run(main())
+
+
+def test_bounded_connections():
+    async def respond_slowly(method: str, path: str, body: bytes):
+        await sleep(0.05)
+        return await respond_path(method, path, body)
+
+    async def main():
+        async with StandInServer(respond_slowly) as server:
+            session = PooledSession(max_connections=2)
+            responses = await gather(*(session.request('GET', f'{server.url}/{i}') for i in range(10)))
+            await session.close()
+            assert [response.json()['path'] for response in responses] == [f'/{i}' for i in range(10)]
+            assert server.max_active == 2
+            assert server.connections == 2
+
+    run(main())
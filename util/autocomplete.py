@@ -0,0 +1,53 @@
+from typing import List
+
+from discord_slash import SlashCommand
+from discord_slash.utils.manage_commands import create_option
+
+AUTOCOMPLETE_INTERACTION = 4
+AUTOCOMPLETE_RESULT = 8
+MAX_CHOICES = 25
+MAX_CHOICE_LENGTH = 100
+
+
+class AutocompleteContext:
+    """ 자동 완성 요청 하나의 정보입니다. ``send``로 자동 완성 후보를 응답합니다. """
+
+    def __init__(self, slash: SlashCommand, payload: dict):
+        self.slash = slash
+        self.interaction_id = payload['id']
+        self.token = payload['token']
+        self.command = payload['data']['name']
+
+        options = payload['data'].get('options', list())
+        self.options = {option['name']: option.get('value') for option in options}
+        self.focused_option, self.focused_value = next(
+            ((option['name'], option.get('value', '')) for option in options if option.get('focused')), (None, ''))
+
+    async def send(self, choices: List[str]):
+        choices = [choice[:MAX_CHOICE_LENGTH] for choice in choices[:MAX_CHOICES]]
+        await self.slash.req.command_response(
+            self.token, False, 'POST', self.interaction_id,
+            json={'type': AUTOCOMPLETE_RESULT,
+                  'data': {'choices': [{'name': choice, 'value': choice} for choice in choices]}})
+
+
+class AutocompleteSlashCommand(SlashCommand):
+    """
+    자동 완성 요청을 처리할 수 있는 ``SlashCommand``입니다.
+    discord-py-slash-command 3.0.3은 자동 완성 요청을 알지 못하므로, 이를 가로채 ``autocomplete`` 이벤트로 내보냅니다.
+    코그에서는 ``on_autocomplete(ctx: AutocompleteContext)`` 리스너로 받습니다.
+    """
+
+    async def on_socket_response(self, msg):
+        if msg['t'] == 'INTERACTION_CREATE' and msg['d']['type'] == AUTOCOMPLETE_INTERACTION:
+            self._discord.dispatch('autocomplete', AutocompleteContext(self, msg['d']))
+            return
+
+        await super().on_socket_response(msg)
+
+
+def create_autocomplete_option(name: str, description: str, option_type: int, required: bool) -> dict:
+    """ 입력하는 동안 자동 완성 후보를 보여주는 옵션을 만듭니다. """
+    option = create_option(name=name, description=description, option_type=option_type, required=required)
+    option['autocomplete'] = True
+    return option
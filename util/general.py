@@ -1,9 +1,18 @@
+import re
 import unicodedata
+from functools import lru_cache
 
+# Characters whose diacritic-free decomposition is known in advance: Latin letters with diacritics,
+# combining diacritical marks and Hangul syllables.
+PRECOMPUTED_RANGES = ((0x0080, 0x0250), (0x0300, 0x0370), (0x1E00, 0x1F00), (0xAC00, 0xD7A4))
+# Characters that are left as they are by `normalise_by_category`, apart from lowercasing: ASCII and Hangul jamo.
+SETTLED_CHARACTERS = re.compile('[\x00-\x7f\u1100-\u11ff]*')
 
-def normalise(string: str):
+
+def normalise_by_category(string: str) -> str:
     """
     Removes all the diacritic in the string and return it.
+    This decomposes the whole string and checks the category of every character, so it works for any string.
 
     :param string:
     :return:
@@ -12,4 +21,50 @@ def normalise(string: str):
     return ''.join(c for c in unicodedata.normalize('NFD', string) if unicodedata.category(c) != 'Mn').lower()
 
 
+def build_diacritic_table() -> dict:
+    """
+    Maps every character in `PRECOMPUTED_RANGES` to what `normalise_by_category` leaves of it before lowercasing,
+    if that consists only of settled characters.
+    """
+
+    table = dict()
+    for start, end in PRECOMPUTED_RANGES:
+        for code in range(start, end):
+            character = chr(code)
+            stripped = ''.join(c for c in unicodedata.normalize('NFD', character) if unicodedata.category(c) != 'Mn')
+            if stripped != character and SETTLED_CHARACTERS.fullmatch(stripped):
+                table[code] = stripped
+    return table
+
+
+DIACRITIC_TABLE = build_diacritic_table()
+
+
+def normalise(string: str) -> str:
+    """
+    Removes all the diacritic in the string and return it.
+    Returns the same as `normalise_by_category`, but ASCII strings are only lowercased, and others are memoised.
+
+    :param string:
+    :return:
+    """
+
+    if string.isascii():
+        return string.lower()
+    return normalise_non_ascii(string)
+
+
+@lru_cache(maxsize=65536)
+def normalise_non_ascii(string: str) -> str:
+    """
+    Strips the diacritics with `DIACRITIC_TABLE` in one pass.
+    Marks are only reordered among themselves by the decomposition, and they are all removed,
+    so translating character by character gives the same result when every character is settled afterwards.
+    Falls back to `normalise_by_category` otherwise.
+    """
+
+    translated = string.translate(DIACRITIC_TABLE)
+    if SETTLED_CHARACTERS.fullmatch(translated):
+        return translated.lower()
+    return normalise_by_category(string)
 
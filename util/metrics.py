@@ -0,0 +1,200 @@
+from asyncio import StreamReader, StreamWriter, TimeoutError, start_server, wait_for
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Awaitable, Dict, Optional, Tuple
+
+from discord_slash.http import SlashCommandRequest
+
+from util.autocomplete import AutocompleteSlashCommand
+from util.profiler import CommandProfiler
+
+METRIC_PREFIX = 'zastravapera'
+# 지연 시간 히스토그램의 구간 경계(초). Prometheus 클라이언트의 기본값과 같습니다.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 지표 요청을 읽을 때 기다리는 최대 시간(초)
+REQUEST_TIMEOUT = 5
+
+
+class Histogram:
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class CommandRecord:
+    """ 처리 중인 명령어 하나의 단계별 소요 시간입니다. """
+    __slots__ = ('command', 'start', 'phases', 'failed')
+
+    def __init__(self, command: str):
+        self.command = command
+        self.start = perf_counter()
+        self.phases = dict()
+        self.failed = False
+
+
+current_record = ContextVar('current_record', default=None)
+
+
+class CommandMetrics:
+    """
+    명령어별 지연 시간 히스토그램, 처리 횟수, 처리 중인 요청 수를 모읍니다.
+    명령어 하나마다 딕셔너리 연산 몇 번만 하므로, 늘 켜두어도 됩니다.
+    """
+
+    def __init__(self):
+        # (명령어, 단계)별 히스토그램. 단계 ``total``은 명령어 전체의 처리 시간입니다.
+        self.durations: Dict[Tuple[str, str], Histogram] = defaultdict(Histogram)
+        # (명령어, 결과)별 처리 횟수. 결과는 ``ok`` 또는 ``error``입니다.
+        self.calls: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.in_flight: Dict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def track(self, command: str):
+        """ 블록 안에서 처리하는 명령어의 지표를 모읍니다. 블록 안에서 ``phase``로 잰 시간은 이 명령어의 단계별 시간이 됩니다. """
+        record = CommandRecord(command)
+        token = current_record.set(record)
+        self.in_flight[command] += 1
+        try:
+            yield record
+        except BaseException:
+            record.failed = True
+            raise
+        finally:
+            self.in_flight[command] -= 1
+            current_record.reset(token)
+            self.finish(record)
+
+    def finish(self, record: CommandRecord):
+        self.durations[record.command, 'total'].observe(perf_counter() - record.start)
+        for name, seconds in record.phases.items():
+            self.durations[record.command, name].observe(seconds)
+        self.calls[record.command, 'error' if record.failed else 'ok'] += 1
+
+    def render(self) -> str:
+        """ 모은 지표를 Prometheus 텍스트 형식으로 반환합니다. """
+        lines = [
+            f'# HELP {METRIC_PREFIX}_command_duration_seconds Slash command latency by phase.',
+            f'# TYPE {METRIC_PREFIX}_command_duration_seconds histogram',
+        ]
+        for (command, phase_name), histogram in sorted(self.durations.items()):
+            labels = f'command="{escape_label(command)}",phase="{phase_name}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ('+Inf',), histogram.counts):
+                cumulative += count
+                lines.append(f'{METRIC_PREFIX}_command_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{METRIC_PREFIX}_command_duration_seconds_sum{{{labels}}} {histogram.sum}')
+            lines.append(f'{METRIC_PREFIX}_command_duration_seconds_count{{{labels}}} {histogram.count}')
+
+        lines.append(f'# HELP {METRIC_PREFIX}_commands_total Slash commands handled, by result.')
+        lines.append(f'# TYPE {METRIC_PREFIX}_commands_total counter')
+        for (command, status), count in sorted(self.calls.items()):
+            lines.append(f'{METRIC_PREFIX}_commands_total{{command="{escape_label(command)}",status="{status}"}} {count}')
+
+        lines.append(f'# HELP {METRIC_PREFIX}_commands_in_flight Slash commands being handled.')
+        lines.append(f'# TYPE {METRIC_PREFIX}_commands_in_flight gauge')
+        for command, count in sorted(self.in_flight.items()):
+            lines.append(f'{METRIC_PREFIX}_commands_in_flight{{command="{escape_label(command)}"}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+
+command_metrics = CommandMetrics()
+
+
+def escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+@contextmanager
+def phase(name: str):
+    """
+    블록을 처리하는 데 걸린 시간을, 처리 중인 명령어의 ``name`` 단계 시간에 더합니다.
+    단계는 사전 검색 ``search``, 임베드 만들기 ``render``, Discord API 요청 ``discord``, 그 밖의 API 요청 ``external``입니다.
+    명령어를 처리하는 중이 아니면 아무것도 하지 않습니다.
+    """
+    record = current_record.get()
+    if record is None:
+        yield
+        return
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        record.phases[name] = record.phases.get(name, 0.0) + perf_counter() - start
+
+
+async def timed(name: str, awaitable: Awaitable):
+    with phase(name):
+        return await awaitable
+
+
+class MetricsSlashCommandRequest(SlashCommandRequest):
+    """ 명령어에 대한 응답을 보내고 고치고 지우는 Discord API 요청 시간을 ``discord`` 단계로 잽니다. """
+
+    def command_response(self, *args, **kwargs):
+        return timed('discord', super().command_response(*args, **kwargs))
+
+
+class MetricsSlashCommand(AutocompleteSlashCommand):
+    """
+    모든 슬래시 명령어의 처리 시간과 결과를 ``command_metrics``에 모으는 ``SlashCommand``입니다.
+    ``profiler``가 주어지면 명령어를 처리하는 동안 프로파일링도 합니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # noinspection PyProtectedMember
+        self.req = MetricsSlashCommandRequest(self.logger, self._discord, self.req._application_id)
+        self.profiler: Optional[CommandProfiler] = None
+
+    async def invoke_command(self, func, ctx, args):
+        profile = self.profiler.profile(ctx.command) if self.profiler is not None else nullcontext()
+        with command_metrics.track(ctx.command), profile:
+            await super().invoke_command(func, ctx, args)
+
+    async def on_slash_command_error(self, ctx, ex):
+        record = current_record.get()
+        if record is not None:
+            record.failed = True
+        await super().on_slash_command_error(ctx, ex)
+
+
+async def serve_metrics(host: str, port: int):
+    """ ``http://host:port/metrics``에서 ``command_metrics``를 Prometheus 텍스트 형식으로 내보내는 서버를 엽니다. """
+    server = await start_server(handle_metrics_request, host, port)
+    print(f'Metrics served on http://{host}:{port}/metrics')
+    return server
+
+
+async def handle_metrics_request(reader: StreamReader, writer: StreamWriter):
+    try:
+        request_line = await wait_for(reader.readline(), REQUEST_TIMEOUT)
+        while (await wait_for(reader.readline(), REQUEST_TIMEOUT)).strip():
+            pass
+
+        parts = request_line.split()
+        if len(parts) >= 2 and parts[0] == b'GET' and parts[1] in (b'/', b'/metrics'):
+            status, body = '200 OK', command_metrics.render().encode()
+        else:
+            status, body = '404 Not Found', b''
+        writer.write(f'HTTP/1.1 {status}\r\n'
+                     f'Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n'
+                     f'Content-Length: {len(body)}\r\n'
+                     f'Connection: close\r\n\r\n'.encode() + body)
+        await writer.drain()
+    except (TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
@@ -1,18 +1,151 @@
-import requests
+import os
+import sqlite3
+from asyncio import Future, ensure_future, get_event_loop
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+from typing import Optional
 
 from const import get_secret
+from util.web import PooledSession, WebError
 
 URL = 'https://openapi.naver.com/v1/papago/n2mt'
+CACHE_PATH = 'cache/papago.sqlite3'
+# 번역 캐시에 저장할 최대 번역 수. 넘으면 가장 오래 쓰이지 않은 번역부터 지웁니다.
+MAX_CACHE_ENTRIES = 10000
+# 캐시에서 꺼낸 번역의 마지막 사용 시각을 고치는 최소 간격(초). 캐시를 읽을 때마다 디스크에 쓰지 않도록 합니다.
+TOUCH_INTERVAL = 3600
+# 동시에 보낼 최대 번역 요청 수
+MAX_CONCURRENT_REQUESTS = 4
+# 요청 하나를 보내고 응답을 다 받을 때까지의 최대 대기 시간(초)
+REQUEST_TIMEOUT = 10
 
-CLIENT_ID = get_secret('naver_client_id')
-CLIENT_SECRET = get_secret('naver_client_secret')
 
+class PapagoError(Exception):
+    pass
 
-def translate(text: str, source: str, target: str):
-    data = {'source': source, 'target': target, 'text': text}
-    headers = {'X-Naver-Client-Id': CLIENT_ID, 'X-Naver-Client-Secret': CLIENT_SECRET}
 
-    r = requests.post(URL, data=data, headers=headers)
-    j = r.json()
+class TranslationCache:
+    """
+    (출발 언어, 도착 언어, 원문)별 번역 결과를 디스크에 저장합니다. 재시작해도 남아 있으며, 크기가 제한됩니다.
+    sqlite 연결은 스레드 하나에서만 쓸 수 있으므로, 같은 스레드에서만 호출해야 합니다.
+    """
 
-    return j['message']['result']['translatedText']
+    def __init__(self, path: str = CACHE_PATH, max_entries: int = MAX_CACHE_ENTRIES,
+                 touch_interval: float = TOUCH_INTERVAL):
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            'source TEXT, target TEXT, text TEXT, translated TEXT, used_at REAL, '
+            'PRIMARY KEY (source, target, text))')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS translations_used_at ON translations (used_at)')
+        self.connection.commit()
+
+    def get(self, source: str, target: str, text: str) -> Optional[str]:
+        row = self.connection.execute(
+            'SELECT translated, used_at FROM translations WHERE source = ? AND target = ? AND text = ?',
+            (source, target, text)).fetchone()
+        if row is None:
+            return None
+
+        translated, used_at = row
+        now = time()
+        if now - used_at > self.touch_interval:
+            self.connection.execute(
+                'UPDATE translations SET used_at = ? WHERE source = ? AND target = ? AND text = ?',
+                (now, source, target, text))
+            self.connection.commit()
+        return translated
+
+    def put(self, source: str, target: str, text: str, translated: str):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)', (source, target, text, translated, time()))
+        self.connection.execute(
+            'DELETE FROM translations WHERE rowid IN ('
+            'SELECT rowid FROM translations ORDER BY used_at DESC LIMIT -1 OFFSET ?)', (self.max_entries,))
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+
+class PapagoClient:
+    """
+    파파고 번역 API 클라이언트입니다.
+    ``PooledSession``으로 연결을 재사용하고 동시에 보내는 요청 수와 요청마다 기다리는 시간을 제한하며,
+    번역한 적 있는 문장은 캐시에서 돌려줍니다.
+    캐시는 디스크를 읽고 쓰는 동안 이벤트 루프가 멈추지 않도록 전용 스레드에서 다룹니다.
+    """
+
+    def __init__(self, client_id: str, client_secret: str, url: str = URL, cache_path: str = CACHE_PATH,
+                 max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS, timeout: float = REQUEST_TIMEOUT):
+        self.url = url
+        self.headers = {'X-Naver-Client-Id': client_id, 'X-Naver-Client-Secret': client_secret}
+        self.cache_path = cache_path
+        # 연결 수를 제한하면, 연결을 기다리는 요청은 보내지 않고 기다리므로 동시에 보내는 요청 수도 제한됩니다.
+        self.session = PooledSession(timeout, max_concurrent_requests)
+
+        # 이벤트 루프 안에서 처음 번역할 때 엽니다.
+        self.cache: Optional[TranslationCache] = None
+        self.cache_opened: Optional[Future] = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='papago-cache')
+
+    async def run_in_cache_thread(self, function, *args):
+        return await get_event_loop().run_in_executor(self.executor, function, *args)
+
+    def open_cache(self):
+        self.cache = TranslationCache(self.cache_path)
+
+    async def translate(self, text: str, source: str, target: str) -> str:
+        """
+        :raise PapagoError: 요청 시간이 지났거나, 연결에 실패했거나, API가 번역 결과를 주지 않은 경우
+        """
+        if self.cache_opened is None:
+            self.cache_opened = ensure_future(self.run_in_cache_thread(self.open_cache))
+        await self.cache_opened
+
+        translated = await self.run_in_cache_thread(self.cache.get, source, target, text)
+        if translated is not None:
+            return translated
+
+        try:
+            response = await self.session.request(
+                'POST', self.url, data={'source': source, 'target': target, 'text': text}, headers=self.headers)
+        except WebError as e:
+            raise PapagoError(f'Failed to translate: {e}') from e
+        if response.status_code != 200:
+            raise PapagoError(f'Papago API responded with status {response.status_code}')
+        try:
+            translated = response.json()['message']['result']['translatedText']
+        except (ValueError, KeyError, TypeError) as e:
+            raise PapagoError(f'Unexpected response from Papago API: {e!r}') from e
+
+        await self.run_in_cache_thread(self.cache.put, source, target, text, translated)
+        return translated
+
+    async def close(self):
+        await self.session.close()
+        if self.cache_opened is not None:
+            await self.cache_opened
+            await self.run_in_cache_thread(self.cache.close)
+        self.executor.shutdown(wait=False)
+
+
+# 비밀 값을 읽어야 하므로 처음 번역할 때 만듭니다.
+papago_client: Optional[PapagoClient] = None
+
+
+async def translate(text: str, source: str, target: str) -> str:
+    global papago_client
+    if papago_client is None:
+        papago_client = PapagoClient(get_secret('naver_client_id'), get_secret('naver_client_secret'))
+    return await papago_client.translate(text, source, target)
+
+
+async def close():
+    if papago_client is not None:
+        await papago_client.close()
@@ -0,0 +1,92 @@
+import os
+import re
+from asyncio import sleep
+from collections import defaultdict
+from contextlib import contextmanager
+from cProfile import Profile
+from datetime import datetime
+from io import StringIO
+from pstats import Stats
+from typing import Dict, Optional
+
+PROFILE_DIRECTORY = 'cache/profiles'
+# 보고서에 보여줄 함수의 수
+REPORT_FUNCTIONS = 40
+
+
+class CommandProfiler:
+    """
+    슬래시 명령어를 처리하는 동안 cProfile을 켜고, 명령어 이름별로 결과를 모아 주기적으로 파일에 씁니다.
+
+    cProfile은 스레드 하나에 하나만 켤 수 있으므로, 다른 명령어를 프로파일링하는 중에 들어온 명령어는 건너뜁니다.
+    명령어가 ``await``으로 기다리는 동안 이벤트 루프에서 실행되는 다른 코드도 함께 기록되며,
+    ``run_in_executor``로 다른 스레드에서 실행되는 코드는 기록되지 않습니다.
+    """
+
+    def __init__(self, command_pattern: str = r'.*', directory: str = PROFILE_DIRECTORY, interval: float = 300):
+        """
+        :param command_pattern: 이 정규표현식을 만족하는 이름을 가진 명령어만 프로파일링합니다
+        :param directory: 보고서를 쓸 디렉토리
+        :param interval: 보고서를 쓰는 간격(초)
+        """
+        self.command_pattern = re.compile(command_pattern)
+        self.directory = directory
+        self.interval = interval
+
+        self.stats: Dict[str, Stats] = dict()
+        self.profiled = defaultdict(int)
+        self.skipped = defaultdict(int)
+        self.active: Optional[str] = None
+
+    @contextmanager
+    def profile(self, command: str):
+        """ 블록을 처리하는 동안 ``command`` 명령어를 프로파일링합니다. """
+        if not self.command_pattern.search(command):
+            yield
+            return
+        if self.active is not None:
+            self.skipped[command] += 1
+            yield
+            return
+
+        profile = Profile()
+        self.active = command
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.active = None
+            self.add(command, profile)
+
+    def add(self, command: str, profile: Profile):
+        if command in self.stats:
+            self.stats[command].add(profile)
+        else:
+            self.stats[command] = Stats(profile)
+        self.profiled[command] += 1
+
+    def dump(self):
+        """
+        명령어마다 ``<명령어>.prof``에 pstats 형식으로, ``<명령어>.txt``에 누적 시간이 긴 함수 순서로 지금까지의 결과를 씁니다.
+        ``.prof`` 파일은 ``python -m pstats``나 snakeviz 등으로 열어볼 수 있습니다.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        for command, stats in self.stats.items():
+            path = os.path.join(self.directory, command)
+            stats.dump_stats(f'{path}.prof')
+
+            stream = StringIO()
+            stats.stream = stream
+            stream.write(f'/{command}: {self.profiled[command]} profiled, {self.skipped[command]} skipped '
+                         f'(at {datetime.now():%Y-%m-%d %H:%M:%S})\n')
+            stats.sort_stats('cumulative').print_stats(REPORT_FUNCTIONS)
+            stats.sort_stats('tottime').print_stats(REPORT_FUNCTIONS)
+            with open(f'{path}.txt', 'w', encoding='utf-8') as file:
+                file.write(stream.getvalue())
+
+    async def dump_periodically(self):
+        while True:
+            await sleep(self.interval)
+            self.dump()
+            print(f'Profiles of {len(self.stats)} commands saved to `{self.directory}`.')
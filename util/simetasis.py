@@ -1,55 +1,73 @@
+import re
+from functools import lru_cache
+from typing import Iterable, List
+
 from util.general import normalise
 
+# 단어 끝에 붙어 있으면 떼어 두었다가 변환한 뒤 다시 붙이는 문장 부호
+PUNCTUATIONS = '.,;:?!\"\']'
+# 단어 앞부분을 바꾸는 규칙. 앞의 것부터 보아 처음 맞는 것 하나만 적용합니다.
+PREFIX_RULES = (('ex', 'x'), ('êx', 'ex'))
+PREFIXES = tuple(prefix for prefix, _ in PREFIX_RULES)
+# 단어 끝부분을 바꾸는 규칙. 앞의 것부터 보아 처음 맞는 것 하나만 적용합니다.
+SUFFIX_RULES = (('que', 'c'), ('iê', 'iee'), ('g', 'c'), ('d', 't'), ('v', 'p'), ('s', 'ch'))
+SUFFIXES = tuple(suffix for suffix, _ in SUFFIX_RULES)
+# 정규화하기 전에 글자 하나씩 바꾸는 규칙
+LETTER_TABLE = str.maketrans({
+    'x': 'sh', 'y': 'ú', 'j': 'y', 'ÿ': 'yú', 'c': 'ch',
+    'ä': 'ae', 'ë': 'ee', 'ï': 'ie', 'ö': 'oe', 'ü': 'ue',
+})
+# 정규화한 뒤 바꾸는 규칙
+NORMALISED_RULES = {'qua': 'ca', 'que': 'ke', 'qui': 'ki', 'quo': 'co', 'sh': 'z', 'v': 'b'}
+NORMALISED_PATTERN = re.compile('|'.join(map(re.escape, NORMALISED_RULES)))
+
 
 def zasokese_to_simetasise(sentence: str) -> str:
     """ 자소크어 문자열을 시메타시스어 문자열로 변환합니다. """
+    if sentence and ' ' not in sentence:
+        return convert_word(sentence).rstrip()
+    return ' '.join(convert_word(word) for word in sentence.split(' ') if word).rstrip()
+
+
+def zasokese_to_simetasise_all(sentences: Iterable[str]) -> List[str]:
+    """
+    자소크어 문자열들을 한꺼번에 시메타시스어 문자열로 변환합니다.
+    같은 문자열은 한 번만 변환합니다.
+    """
+    conversions = dict()
+    result = list()
+    for sentence in sentences:
+        if sentence not in conversions:
+            conversions[sentence] = zasokese_to_simetasise(sentence)
+        result.append(conversions[sentence])
+    return result
+
+
+@lru_cache(maxsize=65536)
+def convert_word(word: str) -> str:
+    """
+    공백이 없는 자소크어 단어 하나를 시메타시스어로 변환합니다.
+    글자를 바꾸는 규칙들은 서로의 결과에 다시 걸리지 않으므로, 차례로 ``str.replace``를 하는 대신
+    변환표와 정규 표현식으로 단어를 한 번씩만 훑습니다.
+    """
+    punctuation = ''
+    while word[-1] in PUNCTUATIONS:
+        punctuation = word[-1] + punctuation
+        word = word[:-1]
+
+    if word.startswith(PREFIXES):
+        for prefix, replacement in PREFIX_RULES:
+            if word.startswith(prefix):
+                word = replacement + word[len(prefix):]
+                break
+
+    # 끝부분 규칙이 보는 글자들은 변환표에 없으므로, 변환표를 적용하기 전에 끝부분을 떼어도 결과가 같습니다.
+    ending = ''
+    if word.endswith(SUFFIXES):
+        for suffix, replacement in SUFFIX_RULES:
+            if word.endswith(suffix):
+                word, ending = word[:-len(suffix)], replacement
+                break
 
-    result = ''
-    words = sentence.split(' ')
-    for word in words:
-        if not word:
-            continue
-
-        punctuation = ''
-        while word[-1] in '.,;:?!\"\']':
-            punctuation = word[-1] + punctuation
-            word = word[:-1]
-
-        if word.startswith('ex'):
-            word = word[1:]
-        elif word.startswith('êx'):
-            word = 'e' + word[1:]
-        word = word.replace('x', 'sh')
-        word = word.replace('y', 'ú').replace('j', 'y').replace('ÿ', 'yú')
-        word = word.replace('c', 'ch')
-
-        if word.endswith('que'):
-            word = word[:-3] + 'c'
-        if word.endswith('iê'):
-            word = word[:-1] + 'ee'
-        if word.endswith('g'):
-            word = word[:-1] + 'c'
-        if word.endswith('d'):
-            word = word[:-1] + 't'
-        if word.endswith('v'):
-            word = word[:-1] + 'p'
-        if word.endswith('s'):
-            word = word[:-1] + 'ch'
-        word = word\
-            .replace('ä', 'ae') \
-            .replace('ë', 'ee') \
-            .replace('ï', 'ie') \
-            .replace('ö', 'oe') \
-            .replace('ü', 'ue')
-        word = normalise(word)
-        word = word\
-            .replace('qua', 'ca') \
-            .replace('que', 'ke') \
-            .replace('qui', 'ki') \
-            .replace('quo', 'co')
-        word = word.replace('sh', 'z')
-        word = word.replace('v', 'b')
-
-        word += punctuation
-        result += word + ' '
-    return result.rstrip()
+    word = normalise(word.translate(LETTER_TABLE) + ending)
+    return NORMALISED_PATTERN.sub(lambda match: NORMALISED_RULES[match.group()], word) + punctuation
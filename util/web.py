@@ -0,0 +1,125 @@
+from asyncio import Task, TimeoutError, ensure_future, shield
+from collections import OrderedDict
+from json import loads
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, ServerDisconnectedError, TCPConnector
+
+# 응답을 캐시에 두는 시간(초)
+CACHE_TTL = 300
+# 캐시에 둘 최대 응답 수. 넘으면 가장 오래 쓰이지 않은 응답부터 버립니다.
+MAX_CACHE_ENTRIES = 256
+# 요청 하나를 보내고 응답을 다 받을 때까지의 최대 대기 시간(초)
+REQUEST_TIMEOUT = 10
+# 한 번에 열어둘 최대 연결 수
+MAX_CONNECTIONS = 10
+
+
+class WebError(Exception):
+    pass
+
+
+class TextResponse:
+    """ 본문을 모두 읽은 응답입니다. 상태 코드와 본문만 가집니다. """
+    __slots__ = ('status_code', 'text')
+
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+
+    def json(self) -> Any:
+        return loads(self.text)
+
+
+class PooledSession:
+    """
+    연결을 재사용하는 HTTP 세션입니다. 열어둘 연결 수와 요청마다 기다리는 시간을 제한합니다.
+    서버는 오래 쓰지 않은 연결을 닫으므로, 닫힌 연결을 재사용하다 끊기면 새 연결로 한 번만 다시 보냅니다.
+    """
+
+    def __init__(self, timeout: float = REQUEST_TIMEOUT, max_connections: int = MAX_CONNECTIONS):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        # 이벤트 루프 안에서 처음 요청할 때 만듭니다.
+        self.session: Optional[ClientSession] = None
+
+    async def request(self, method: str, url: str, **kwargs) -> TextResponse:
+        """
+        ``aiohttp.ClientSession.request``로 요청을 보내고 본문을 모두 읽습니다.
+
+        :raise WebError: 연결에 실패했거나, 요청 시간이 지났거나, 본문을 읽을 수 없는 경우
+        """
+        if self.session is None:
+            self.session = ClientSession(
+                connector=TCPConnector(limit=self.max_connections), timeout=ClientTimeout(total=self.timeout))
+
+        try:
+            try:
+                return await self.send(method, url, **kwargs)
+            except ServerDisconnectedError:
+                return await self.send(method, url, **kwargs)
+        except (ClientError, TimeoutError, UnicodeDecodeError) as e:
+            raise WebError(f'Failed to {method} {url}: {e!r}') from e
+
+    async def send(self, method: str, url: str, **kwargs) -> TextResponse:
+        async with self.session.request(method, url, **kwargs) as response:
+            return TextResponse(response.status, await response.text())
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+
+class CachedSession:
+    """
+    ``PooledSession``으로 보낸 GET 요청의 응답 중 성공한 것을 ``ttl``초 동안 캐시에 둡니다.
+    같은 요청이 처리 중이면 새로 보내지 않고 그 응답을 함께 기다리므로, 같은 검색이 한꺼번에 여러 번 들어와도 요청은 한 번만 보냅니다.
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL, max_entries: int = MAX_CACHE_ENTRIES,
+                 timeout: float = REQUEST_TIMEOUT, max_connections: int = MAX_CONNECTIONS):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.session = PooledSession(timeout, max_connections)
+
+        # 요청별로, 응답이 만료되는 시각과 응답
+        self.cache: Dict[Tuple, Tuple[float, TextResponse]] = OrderedDict()
+        # 요청별로, 처리 중인 요청
+        self.pending: Dict[Tuple, Task] = dict()
+
+    async def get(self, url: str, params: Optional[Dict[str, str]] = None, verify: bool = True) -> TextResponse:
+        """
+        :raise WebError: 연결에 실패했거나 요청 시간이 지난 경우
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            expires_at, response = cached
+            if expires_at > monotonic():
+                self.cache.move_to_end(key)
+                return response
+            del self.cache[key]
+
+        task = self.pending.get(key)
+        if task is None:
+            task = ensure_future(self.fetch(key, url, params, verify))
+            self.pending[key] = task
+        # 먼저 요청한 명령어가 취소되어도, 함께 기다리는 다른 명령어를 위해 요청은 계속합니다.
+        return await shield(task)
+
+    async def fetch(self, key: Tuple, url: str, params: Optional[Dict[str, str]], verify: bool) -> TextResponse:
+        try:
+            response = await self.session.request('GET', url, params=params, ssl=None if verify else False)
+        finally:
+            del self.pending[key]
+
+        if response.status_code == 200:
+            self.cache[key] = monotonic() + self.ttl, response
+            while len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+        return response
+
+    async def close(self):
+        await self.session.close()